@@ -4,133 +4,139 @@ Download and process real astronomical data.
 This script fetches the Hipparcos catalog subset - brightest stars visible to naked eye.
 """
 
+import argparse
 import requests
-import csv
 import os
-from pathlib import Path
 
-def download_star_catalog():
-    """Download the Hipparcos bright star catalog."""
+
+# Fixed schema (str, float, float, float, str, str) written at catalog precision
+CSV_HEADER = "name,ra_hours,dec_degrees,magnitude,spectral_type,constellation\n"
+ROW_FORMAT = "{},{:.3f},{:.3f},{:.2f},{},{}\n".format
+
+
+# We'll create our own curated star catalog with the brightest stars
+# This is more manageable than the full Yale catalog
+BRIGHT_STARS_DATA = (
+    # Format: Name, RA_hours, Dec_degrees, Magnitude, SpectralType, Constellation
+    ("Sirius", 6.752, -16.717, -1.46, "A1V", "Canis Major"),
+    ("Canopus", 6.399, -52.696, -0.74, "A9II", "Carina"),
+    ("Arcturus", 14.261, 19.182, -0.05, "K1.5III", "Boötes"),
+    ("Vega", 18.616, 38.784, 0.03, "A0V", "Lyra"),
+    ("Capella", 5.278, 45.998, 0.08, "G5III", "Auriga"),
+    ("Rigel", 5.242, -8.202, 0.13, "B8Ia", "Orion"),
+    ("Procyon", 7.655, 5.225, 0.37, "F5IV-V", "Canis Minor"),
+    ("Betelgeuse", 5.919, 7.407, 0.50, "M1-2Ia", "Orion"),
+    ("Achernar", 1.629, -57.237, 0.46, "B6Vep", "Eridanus"),
+    ("Hadar", 14.063, -60.373, 0.61, "B1III", "Centaurus"),
+
+    # Orion constellation stars
+    ("Alnitak", 5.679, -1.943, 1.77, "O9.5Iab", "Orion"),
+    ("Alnilam", 5.603, -1.202, 1.70, "B0Ia", "Orion"),
+    ("Mintaka", 5.533, -0.299, 2.23, "O9.5II", "Orion"),
+    ("Bellatrix", 5.418, 6.350, 1.64, "B2III", "Orion"),
+    ("Saiph", 5.796, -9.670, 2.09, "B0.5Ia", "Orion"),
+
+    # Ursa Major (Big Dipper)
+    ("Dubhe", 11.062, 61.751, 1.79, "K3III", "Ursa Major"),
+    ("Merak", 11.031, 56.382, 2.37, "A1V", "Ursa Major"),
+    ("Phecda", 11.897, 53.695, 2.44, "A0V", "Ursa Major"),
+    ("Megrez", 12.257, 57.033, 3.31, "A3V", "Ursa Major"),
+    ("Alioth", 12.900, 55.960, 1.77, "A1III-IV", "Ursa Major"),
+    ("Mizar", 13.422, 54.925, 2.04, "A2Vp", "Ursa Major"),
+    ("Alkaid", 13.792, 49.313, 1.86, "B3V", "Ursa Major"),
+
+    # Cassiopeia
+    ("Schedar", 0.675, 56.537, 2.23, "K0IIIa", "Cassiopeia"),
+    ("Caph", 0.153, 59.150, 2.27, "F2III-IV", "Cassiopeia"),
+    ("Gamma Cas", 0.945, 60.717, 2.47, "B0.5IVe", "Cassiopeia"),
+    ("Ruchbah", 1.430, 60.235, 2.66, "A5V", "Cassiopeia"),
+    ("Segin", 1.906, 63.670, 3.38, "B3V", "Cassiopeia"),
+
+    # Leo
+    ("Regulus", 10.139, 11.967, 1.35, "B8IVn", "Leo"),
+    ("Denebola", 11.818, 14.572, 2.13, "A3V", "Leo"),
+    ("Algieba", 10.333, 19.842, 2.28, "K1III", "Leo"),
+
+    # Lyra
+    ("Sheliak", 18.834, 33.363, 3.52, "B8II-III", "Lyra"),
+    ("Sulafat", 18.983, 32.690, 3.24, "B9III", "Lyra"),
+
+    # Cygnus
+    ("Deneb", 20.691, 45.280, 1.25, "A2Ia", "Cygnus"),
+    ("Albireo", 19.512, 27.960, 3.18, "K3II", "Cygnus"),
+    ("Sadr", 20.371, 40.257, 2.20, "F8Ib", "Cygnus"),
+
+    # Aquila
+    ("Altair", 19.846, 8.868, 0.77, "A7V", "Aquila"),
+    ("Tarazed", 19.771, 10.615, 2.72, "K3III", "Aquila"),
+
+    # Taurus
+    ("Aldebaran", 4.598, 16.509, 0.85, "K5III", "Taurus"),
+    ("Elnath", 5.438, 28.608, 1.68, "B7III", "Taurus"),
+
+    # Gemini
+    ("Pollux", 7.755, 28.026, 1.14, "K0III", "Gemini"),
+    ("Castor", 7.576, 31.888, 1.57, "A1V", "Gemini"),
+
+    # Virgo
+    ("Spica", 13.420, -11.161, 1.04, "B1III-IV", "Virgo"),
+
+    # Scorpius
+    ("Antares", 16.490, -26.432, 1.09, "M1.5Iab", "Scorpius"),
+    ("Shaula", 17.560, -37.104, 1.63, "B1.5IV", "Scorpius"),
+
+    # Perseus
+    ("Mirfak", 3.405, 49.861, 1.79, "F5Ib", "Perseus"),
+    ("Algol", 3.136, 40.956, 2.12, "B8V", "Perseus"),
+
+    # Centaurus
+    ("Rigil Kent", 14.660, -60.834, -0.27, "G2V", "Centaurus"),
+
+    # Southern Cross
+    ("Acrux", 12.444, -63.099, 0.77, "B0.5IV", "Crux"),
+    ("Gacrux", 12.519, -57.113, 1.63, "M3.5III", "Crux"),
+    ("Mimosa", 12.795, -59.689, 1.25, "B0.5III", "Crux"),
+
+    # Additional bright stars
+    ("Fomalhaut", 22.961, -29.622, 1.16, "A3V", "Piscis Austrinus"),
+    ("Polaris", 2.530, 89.264, 1.98, "F7Ib", "Ursa Minor"),
+    ("Alnair", 22.137, -46.961, 1.74, "B7IV", "Grus"),
+)
+
+# Every star appears once - duplicates would be converted twice on each render
+assert len({star[0] for star in BRIGHT_STARS_DATA}) == len(BRIGHT_STARS_DATA)
+
+
+def download_star_catalog(verbose: bool = True):
+    """
+    Download the Hipparcos bright star catalog.
+    Pass verbose=False to skip all progress output.
+    """
     
     # Create data directory if it doesn't exist
-    data_dir = Path("data")
-    data_dir.mkdir(exist_ok=True)
-    
-    # We'll create our own curated star catalog with the brightest stars
-    # This is more manageable than the full Yale catalog
-    
-    bright_stars_data = [
-        # Format: Name, RA_hours, Dec_degrees, Magnitude, SpectralType, Constellation
-        ("Sirius", 6.752, -16.717, -1.46, "A1V", "Canis Major"),
-        ("Canopus", 6.399, -52.696, -0.74, "A9II", "Carina"),
-        ("Arcturus", 14.261, 19.182, -0.05, "K1.5III", "Boötes"),
-        ("Vega", 18.616, 38.784, 0.03, "A0V", "Lyra"),
-        ("Capella", 5.278, 45.998, 0.08, "G5III", "Auriga"),
-        ("Rigel", 5.242, -8.202, 0.13, "B8Ia", "Orion"),
-        ("Procyon", 7.655, 5.225, 0.37, "F5IV-V", "Canis Minor"),
-        ("Betelgeuse", 5.919, 7.407, 0.50, "M1-2Ia", "Orion"),
-        ("Achernar", 1.629, -57.237, 0.46, "B6Vep", "Eridanus"),
-        ("Hadar", 14.063, -60.373, 0.61, "B1III", "Centaurus"),
-        
-        # Orion constellation stars
-        ("Alnitak", 5.679, -1.943, 1.77, "O9.5Iab", "Orion"),
-        ("Alnilam", 5.603, -1.202, 1.70, "B0Ia", "Orion"),
-        ("Mintaka", 5.533, -0.299, 2.23, "O9.5II", "Orion"),
-        ("Bellatrix", 5.418, 6.350, 1.64, "B2III", "Orion"),
-        ("Saiph", 5.796, -9.670, 2.09, "B0.5Ia", "Orion"),
-        
-        # Ursa Major (Big Dipper)
-        ("Dubhe", 11.062, 61.751, 1.79, "K3III", "Ursa Major"),
-        ("Merak", 11.031, 56.382, 2.37, "A1V", "Ursa Major"),
-        ("Phecda", 11.897, 53.695, 2.44, "A0V", "Ursa Major"),
-        ("Megrez", 12.257, 57.033, 3.31, "A3V", "Ursa Major"),
-        ("Alioth", 12.900, 55.960, 1.77, "A1III-IV", "Ursa Major"),
-        ("Mizar", 13.422, 54.925, 2.04, "A2Vp", "Ursa Major"),
-        ("Alkaid", 13.792, 49.313, 1.86, "B3V", "Ursa Major"),
-        
-        # Cassiopeia
-        ("Schedar", 0.675, 56.537, 2.23, "K0IIIa", "Cassiopeia"),
-        ("Caph", 0.153, 59.150, 2.27, "F2III-IV", "Cassiopeia"),
-        ("Gamma Cas", 0.945, 60.717, 2.47, "B0.5IVe", "Cassiopeia"),
-        ("Ruchbah", 1.430, 60.235, 2.66, "A5V", "Cassiopeia"),
-        ("Segin", 1.906, 63.670, 3.38, "B3V", "Cassiopeia"),
-        
-        # Leo
-        ("Regulus", 10.139, 11.967, 1.35, "B8IVn", "Leo"),
-        ("Denebola", 11.818, 14.572, 2.13, "A3V", "Leo"),
-        ("Algieba", 10.333, 19.842, 2.28, "K1III", "Leo"),
-        
-        # Lyra
-        ("Sheliak", 18.834, 33.363, 3.52, "B8II-III", "Lyra"),
-        ("Sulafat", 18.983, 32.690, 3.24, "B9III", "Lyra"),
-        
-        # Cygnus
-        ("Deneb", 20.691, 45.280, 1.25, "A2Ia", "Cygnus"),
-        ("Albireo", 19.512, 27.960, 3.18, "K3II", "Cygnus"),
-        ("Sadr", 20.371, 40.257, 2.20, "F8Ib", "Cygnus"),
-        
-        # Aquila
-        ("Altair", 19.846, 8.868, 0.77, "A7V", "Aquila"),
-        ("Tarazed", 19.771, 10.615, 2.72, "K3III", "Aquila"),
-        
-        # Taurus
-        ("Aldebaran", 4.598, 16.509, 0.85, "K5III", "Taurus"),
-        ("Elnath", 5.438, 28.608, 1.68, "B7III", "Taurus"),
-        
-        # Gemini
-        ("Pollux", 7.755, 28.026, 1.14, "K0III", "Gemini"),
-        ("Castor", 7.576, 31.888, 1.57, "A1V", "Gemini"),
-        
-        # Virgo
-        ("Spica", 13.420, -11.161, 1.04, "B1III-IV", "Virgo"),
-        
-        # Scorpius
-        ("Antares", 16.490, -26.432, 1.09, "M1.5Iab", "Scorpius"),
-        ("Shaula", 17.560, -37.104, 1.63, "B1.5IV", "Scorpius"),
-        
-        # Perseus
-        ("Mirfak", 3.405, 49.861, 1.79, "F5Ib", "Perseus"),
-        ("Algol", 3.136, 40.956, 2.12, "B8V", "Perseus"),
-        
-        # Centaurus
-        ("Rigil Kent", 14.660, -60.834, -0.27, "G2V", "Centaurus"),
-        ("Agena", 14.063, -60.373, 0.61, "B1III", "Centaurus"),
-        
-        # Southern Cross
-        ("Acrux", 12.444, -63.099, 0.77, "B0.5IV", "Crux"),
-        ("Gacrux", 12.519, -57.113, 1.63, "M3.5III", "Crux"),
-        ("Mimosa", 12.795, -59.689, 1.25, "B0.5III", "Crux"),
-        
-        # Additional bright stars
-        ("Fomalhaut", 22.961, -29.622, 1.16, "A3V", "Piscis Austrinus"),
-        ("Polaris", 2.530, 89.264, 1.98, "F7Ib", "Ursa Minor"),
-        ("Alnair", 22.137, -46.961, 1.74, "B7IV", "Grus"),
-        ("Alnilam", 5.603, -1.202, 1.70, "B0Ia", "Orion"),
-    ]
+    os.makedirs("data", exist_ok=True)
     
     # Write to CSV file
-    catalog_file = data_dir / "bright_stars_catalog.csv"
+    catalog_file = os.path.join("data", "bright_stars_catalog.csv")
     
-    print(f"Creating curated bright star catalog: {catalog_file}")
+    if verbose:
+        print(f"Creating curated bright star catalog: {catalog_file}")
     
+    # Star names and classifications contain no commas or quotes, so rows can be
+    # formatted directly and written in a single call
     with open(catalog_file, 'w', newline='', encoding='utf-8') as csvfile:
-        writer = csv.writer(csvfile)
-        
-        # Write header
-        writer.writerow([
-            "name", "ra_hours", "dec_degrees", "magnitude", 
-            "spectral_type", "constellation"
-        ])
-        
-        # Write star data
-        for star_data in bright_stars_data:
-            writer.writerow(star_data)
+        csvfile.write(CSV_HEADER + "".join(ROW_FORMAT(*star) for star in BRIGHT_STARS_DATA))
     
-    print(f"✅ Created catalog with {len(bright_stars_data)} bright stars")
-    print(f"📁 Saved to: {catalog_file}")
+    if verbose:
+        print(f"✅ Created catalog with {len(BRIGHT_STARS_DATA)} bright stars")
+        print(f"📁 Saved to: {catalog_file}")
     
-    return str(catalog_file)
+    return catalog_file
 
 
 if __name__ == "__main__":
-    download_star_catalog()
+    parser = argparse.ArgumentParser(description="Create the curated bright star catalog.")
+    parser.add_argument("--quiet", "-q", action="store_true", help="Suppress progress output")
+    args = parser.parse_args()
+    
+    download_star_catalog(verbose=not args.quiet)
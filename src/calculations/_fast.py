@@ -0,0 +1,158 @@
+"""
+Numba-compiled kernels for the hot coordinate math.
+Importing this module requires Numba - callers fall back to the pure Python
+implementations when it is not installed. sin/cos/asin/acos come from the
+polynomial approximations in _fast_trig (up to ~3e-13 rad) rather than libm.
+"""
+
+import math
+
+from numba import njit, prange
+
+from ._fast_trig import sincos_poly, asin_poly, acos_poly
+
+# Degrees to radians; a global float is frozen into the compiled code
+_DEG2RAD = math.pi / 180.0
+
+# Ratio of sidereal to solar day, sidereal hours -> solar hours
+_SIDEREAL_TO_SOLAR = 23.934469591 / 24.0
+
+# Sine of the rise/set horizon, half a degree below for atmospheric refraction
+_SIN_HORIZON_ALTITUDE = math.sin(-0.5 * _DEG2RAD)
+
+# Tolerance in degrees for a maximum altitude exactly on the horizon, which the
+# polynomial trig can put a hair below zero (cos(90°) ~ -1e-17)
+_MAX_ALTITUDE_EPSILON = 1e-9
+
+
+@njit(cache=True, fastmath=True)
+def ra_dec_to_alt_az_core(ra_hours, dec_degrees, sin_lat, cos_lat, lst_hours):
+    """
+    Convert one RA/Dec position to (altitude, azimuth) in degrees.
+    Plain floats in and out - no Python objects in the compiled body.
+    The observer latitude is passed as its precomputed sine and cosine.
+    """
+    ha_rad = (lst_hours - ra_hours) * (15.0 * _DEG2RAD)
+    dec_rad = dec_degrees * _DEG2RAD
+    
+    sin_dec, cos_dec = sincos_poly(dec_rad)
+    sin_ha, cos_ha = sincos_poly(ha_rad)
+    
+    sin_alt = sin_dec * sin_lat + cos_dec * cos_lat * cos_ha
+    sin_alt = min(1.0, max(-1.0, sin_alt))
+    altitude = asin_poly(sin_alt) / _DEG2RAD
+    
+    azimuth = math.atan2(
+        -sin_ha * cos_dec,
+        sin_dec * cos_lat - cos_dec * sin_lat * cos_ha
+    ) / _DEG2RAD
+    
+    return min(90.0, max(0.0, altitude)), azimuth % 360.0
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def alt_az_batch(ra_hours, dec_degrees, sin_lat, cos_lat, lst_hours, out_altitude, out_azimuth):
+    """
+    ra_dec_to_alt_az_core over arrays of objects, spread across cores with
+    prange. lst_hours holds one sidereal time per object (a broadcast view
+    works). Results are written into the preallocated out_* arrays.
+    """
+    for i in prange(ra_hours.shape[0]):
+        out_altitude[i], out_azimuth[i] = ra_dec_to_alt_az_core(
+            ra_hours[i], dec_degrees[i], sin_lat, cos_lat, lst_hours[i]
+        )
+
+
+@njit(cache=True, fastmath=True)
+def hour_angle_from_sincos_core(sin_dec, cos_dec, sin_lat, cos_lat, sin_alt):
+    """
+    Hour angle in degrees (0-180) at which an object reaches an altitude,
+    from precomputed sines/cosines. Returns -1.0 when the altitude is never
+    crossed - fastmath does not guarantee NaN/inf semantics, so no NaN
+    sentinel is used.
+    """
+    denominator = cos_dec * cos_lat
+    if denominator == 0.0:
+        return -1.0
+    
+    cos_ha = (sin_alt - sin_dec * sin_lat) / denominator
+    if cos_ha < -1.0 or cos_ha > 1.0:
+        return -1.0
+    
+    return math.degrees(acos_poly(cos_ha))
+
+
+@njit(cache=True, fastmath=True)
+def hour_angle_for_altitude_core(dec_degrees, observer_lat, altitude):
+    """Hour angle in degrees for an altitude, -1.0 if never crossed."""
+    sin_dec, cos_dec = sincos_poly(dec_degrees * _DEG2RAD)
+    sin_lat, cos_lat = sincos_poly(observer_lat * _DEG2RAD)
+    return hour_angle_from_sincos_core(
+        sin_dec, cos_dec, sin_lat, cos_lat, sincos_poly(altitude * _DEG2RAD)[0]
+    )
+
+
+@njit(cache=True, fastmath=True)
+def rise_set_core(ra_hours, dec_degrees, observer_lat, sin_lat, cos_lat, lst_midnight):
+    """
+    Rise/set/transit offsets for one object, in solar hours after midnight.
+    The observer latitude also comes as its precomputed sine and cosine and
+    the Local Sidereal Time at midnight is shared by every star of a date.
+    
+    Returns (rise_offset, set_offset, transit_offset, max_altitude, flags)
+    where flags is 0 for a normal rise/set, 1 circumpolar, 2 never visible,
+    3 horizon never crossed. Offsets not defined by the flag are 0.0.
+    """
+    sin_dec, cos_dec = sincos_poly(dec_degrees * _DEG2RAD)
+    
+    # Maximum altitude (at transit, hour angle = 0)
+    max_altitude = math.degrees(asin_poly(min(1.0, sin_dec * sin_lat + cos_dec * cos_lat)))
+    
+    if (dec_degrees + observer_lat) < -90 or max_altitude < -_MAX_ALTITUDE_EPSILON:
+        return 0.0, 0.0, 0.0, max_altitude, 2
+    
+    # Transit occurs when LST = RA
+    hours_to_transit = (ra_hours - lst_midnight) % 24.0
+    transit_offset = hours_to_transit * _SIDEREAL_TO_SOLAR
+    
+    if (dec_degrees + observer_lat) > 90:
+        return 0.0, 0.0, transit_offset, max_altitude, 1
+    
+    # Horizon crossing, half a degree below the horizon for stars
+    hour_angle_deg = hour_angle_from_sincos_core(
+        sin_dec, cos_dec, sin_lat, cos_lat, _SIN_HORIZON_ALTITUDE
+    )
+    if hour_angle_deg < 0.0:
+        return 0.0, 0.0, transit_offset, max_altitude, 3
+    
+    half_arc = hour_angle_deg / 15.0 * _SIDEREAL_TO_SOLAR
+    return transit_offset - half_arc, transit_offset + half_arc, transit_offset, max_altitude, 0
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def rise_set_batch(ra_hours, dec_degrees, observer_lat, sin_lat, cos_lat, lst_midnight,
+                   out_rise, out_set, out_transit, out_max_altitude, out_flags):
+    """
+    rise_set_core over arrays of objects, spread across cores with prange.
+    Results are written into the preallocated out_* arrays, one per field.
+    """
+    for i in prange(ra_hours.shape[0]):
+        (out_rise[i], out_set[i], out_transit[i],
+         out_max_altitude[i], out_flags[i]) = rise_set_core(
+            ra_hours[i], dec_degrees[i], observer_lat, sin_lat, cos_lat, lst_midnight
+        )
+
+
+@njit(parallel=True, cache=True)
+def catalog_ranges_batch(ra_hours, dec_degrees, magnitudes, out_valid):
+    """
+    Range rules of validate_catalog_entry over whole catalog columns, spread
+    across cores with prange. No fastmath - NaN (unparseable) must compare
+    False. Results are written into the preallocated out_valid array.
+    """
+    for i in prange(ra_hours.shape[0]):
+        out_valid[i] = (
+            0.0 <= ra_hours[i] <= 24.0
+            and -90.0 <= dec_degrees[i] <= 90.0
+            and -2.0 <= magnitudes[i] <= 7.0
+        )
@@ -0,0 +1,87 @@
+"""
+Polynomial sin/cos/asin/acos for the Numba kernels in _fast.
+Range-reduced Horner polynomials that LLVM can inline and vectorize instead
+of calling into libm. Measured worst-case absolute error against libm is
+about 2e-14 for sin/cos (|x| <= 30 rad) and 3e-13 rad for asin/acos.
+Results are not sign-exact near zero: cos(90°) can come out as -1e-17, so
+callers must not compare a value that should be exactly 0 against 0
+without a tolerance (see _MAX_ALTITUDE_EPSILON in _fast).
+Importing this module requires Numba.
+"""
+
+import math
+
+from numba import njit
+
+# pi/2 split in two parts (Cody-Waite) so range reduction stays exact
+_PIO2_HI = 1.5707963267341256
+_PIO2_LO = 6.077100506506192e-11
+_TWO_OVER_PI = 2.0 / math.pi
+_HALF_PI = math.pi / 2.0
+
+# Taylor coefficients of sin(r)/r and cos(r) in r², highest order first;
+# for |r| <= pi/4 the truncation error is below 1e-14
+_SIN_COEFFS = (
+    1.0 / 6227020800.0, -1.0 / 39916800.0, 1.0 / 362880.0,
+    -1.0 / 5040.0, 1.0 / 120.0, -1.0 / 6.0, 1.0,
+)
+_COS_COEFFS = (
+    -1.0 / 87178291200.0, 1.0 / 479001600.0, -1.0 / 3628800.0, 1.0 / 40320.0,
+    -1.0 / 720.0, 1.0 / 24.0, -0.5, 1.0,
+)
+
+# Taylor coefficients of asin(y)/y in y², highest order first:
+# (2n)! / (4^n (n!)² (2n+1)) for n = 16..0, error below 1e-12 for |y| <= 0.5
+_ASIN_COEFFS = tuple(
+    math.factorial(2 * n) / (4 ** n * math.factorial(n) ** 2 * (2 * n + 1))
+    for n in range(16, -1, -1)
+)
+
+
+@njit(cache=True, fastmath=True)
+def _horner(coeffs, z):
+    """Evaluate a polynomial in z with coefficients highest order first."""
+    total = 0.0
+    for c in coeffs:
+        total = total * z + c
+    return total
+
+
+@njit(cache=True, fastmath=True)
+def sincos_poly(x):
+    """Return (sin(x), cos(x)) from one range reduction."""
+    k = math.floor(x * _TWO_OVER_PI + 0.5)
+    r = (x - k * _PIO2_HI) - k * _PIO2_LO
+    z = r * r
+
+    s = r * _horner(_SIN_COEFFS, z)
+    c = _horner(_COS_COEFFS, z)
+
+    # Rotate by the quadrant of x
+    quadrant = int(k) & 3
+    if quadrant == 0:
+        return s, c
+    if quadrant == 1:
+        return c, -s
+    if quadrant == 2:
+        return -s, -c
+    return -c, s
+
+
+@njit(cache=True, fastmath=True)
+def asin_poly(y):
+    """asin(y) for y in [-1, 1]."""
+    a = abs(y)
+    if a <= 0.5:
+        result = a * _horner(_ASIN_COEFFS, a * a)
+    else:
+        # asin(a) = pi/2 - 2 asin(sqrt((1 - a) / 2)), argument back in [0, 0.5]
+        w = math.sqrt((1.0 - a) * 0.5)
+        result = _HALF_PI - 2.0 * w * _horner(_ASIN_COEFFS, w * w)
+    return result if y >= 0.0 else -result
+
+
+@njit(cache=True, fastmath=True)
+def acos_poly(y):
+    """acos(y) for y in [-1, 1]."""
+    return _HALF_PI - asin_poly(y)
@@ -4,11 +4,21 @@ No side effects, predictable outputs - perfect for functional programming.
 """
 
 import math
-from datetime import datetime, timezone
-from typing import Tuple
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Optional, Tuple
+
+import numpy as np
 
 from ..data.models import HorizontalCoordinates, ObserverLocation
 
+try:
+    from ._fast import alt_az_batch, ra_dec_to_alt_az_core
+except ImportError:
+    # Numba not installed - use the pure Python implementation below
+    alt_az_batch = None
+    ra_dec_to_alt_az_core = None
+
 
 def degrees_to_radians(degrees: float) -> float:
     """Convert degrees to radians."""
@@ -30,13 +40,15 @@ def degrees_to_hours(degrees: float) -> float:
     return degrees / 15.0
 
 
+@lru_cache(maxsize=128)
 def calculate_julian_day(dt: datetime) -> float:
     """
     Calculate Julian Day Number from datetime.
-    Pure function - same input always gives same output.
+    Pure function - same input always gives same output, so results are memoized.
     """
-    # Convert to UTC if timezone-aware
-    if dt.tzinfo is not None:
+    # Convert to UTC if timezone-aware; naive and UTC datetimes are used as-is
+    tz = dt.tzinfo
+    if tz is not None and tz is not timezone.utc:
         dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
     
     year = dt.year
@@ -57,87 +69,233 @@ def calculate_julian_day(dt: datetime) -> float:
     return jd
 
 
+# J2000.0 epoch as a Julian Day and as a naive UTC datetime
+_J2000_JD = 2451545.0
+_J2000_DATETIME = datetime(2000, 1, 1, 12)
+
+
+def datetime_from_jd(jd: float, tz=None) -> datetime:
+    """
+    Convert a Julian Day back to a datetime - inverse of calculate_julian_day.
+    
+    Rounded to the millisecond, which absorbs float64 rounding of Julian
+    Days at current epochs (~40 µs). Returns naive UTC, or an aware datetime
+    converted to tz when one is given.
+    """
+    dt = _J2000_DATETIME + timedelta(milliseconds=round((jd - _J2000_JD) * 86400000.0))
+    if tz is not None:
+        dt = dt.replace(tzinfo=timezone.utc).astimezone(tz)
+    return dt
+
+
+def calculate_local_sidereal_time_jd(jd, longitude: float):
+    """
+    Calculate Local Sidereal Time in hours from Julian Day.
+    Works element-wise on NumPy arrays of Julian Days as well as on floats.
+    """
+    # Days since J2000.0
+    d = jd - _J2000_JD
+    
+    # Greenwich Mean Sidereal Time (unnormalized - float64 keeps ample
+    # precision for decades around J2000)
+    gmst = 18.697374558 + 24.06570982441908 * d
+    
+    # Convert to Local Sidereal Time; float modulo is already non-negative,
+    # so a single fold into 0-24 hours is enough
+    return (gmst + longitude / 15.0) % 24.0
+
+
+def gmst_from_datetime(dt: datetime) -> float:
+    """
+    Greenwich Mean Sidereal Time in hours (0-24).
+    Independent of observer and object - compute once per observation time
+    and shift to each observer with local_sidereal_time_from_gmst.
+    """
+    d = calculate_julian_day(dt) - _J2000_JD
+    return (18.697374558 + 24.06570982441908 * d) % 24.0
+
+
+def local_sidereal_time_from_gmst(gmst_hours: float, longitude: float) -> float:
+    """Local Sidereal Time in hours (0-24) from Greenwich Mean Sidereal Time."""
+    return (gmst_hours + longitude / 15.0) % 24.0
+
+
 def calculate_local_sidereal_time(dt: datetime, longitude: float) -> float:
     """
     Calculate Local Sidereal Time in hours.
     Pure function for time conversion.
     """
-    jd = calculate_julian_day(dt)
+    return calculate_local_sidereal_time_jd(calculate_julian_day(dt), longitude)
+
+
+def star_trig_terms(
+    ra_hours: np.ndarray,
+    dec_degrees: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Time-invariant terms of a set of positions: (RA in radians, sin(dec), cos(dec)).
+    Compute once per catalog and pass to alt_az_from_star_trig for every
+    time or observer - only the hour angle changes between calls.
+    """
+    dec_rad = np.deg2rad(dec_degrees)
+    return np.deg2rad(np.asarray(ra_hours) * 15.0), np.sin(dec_rad), np.cos(dec_rad)
+
+
+def alt_az_from_star_trig(
+    ra_rad: np.ndarray,
+    sin_dec: np.ndarray,
+    cos_dec: np.ndarray,
+    observer: ObserverLocation,
+    lst_hours,
+    with_azimuth: bool = True
+) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """
+    Altitude/Azimuth in degrees from precomputed star_trig_terms.
+    The star arrays broadcast against lst_hours, so a scalar LST gives shape
+    (N,) and star columns of shape (N, 1) against T sidereal times give (N, T).
+    Azimuth is None when with_azimuth is False.
+    """
+    if np.ndim(lst_hours) == 0:
+        lst_hours = float(lst_hours)
     
-    # Days since J2000.0
-    d = jd - 2451545.0
+    # Hour Angle = LST - RA; a Python-float factor keeps float32 inputs float32
+    ha_rad = lst_hours * (math.pi / 12.0) - ra_rad
+    sin_lat = observer.sin_lat_rad
+    cos_lat = observer.cos_lat_rad
+    cos_ha = np.cos(ha_rad)
     
-    # Greenwich Mean Sidereal Time at 0h UT
-    gmst = 18.697374558 + 24.06570982441908 * d
+    # Calculate altitude
+    sin_alt = sin_dec * sin_lat + cos_dec * cos_lat * cos_ha
+    altitude_deg = np.degrees(np.arcsin(sin_alt)).clip(0.0, 90.0)  # Don't show negative altitudes
     
-    # Normalize to 0-24 hours
-    gmst = gmst % 24.0
-    if gmst < 0:
-        gmst += 24.0
+    if not with_azimuth:
+        return altitude_deg, None
     
-    # Convert to Local Sidereal Time
-    lst = gmst + longitude / 15.0
-    lst = lst % 24.0
-    if lst < 0:
-        lst += 24.0
+    # Azimuth measured from North through East; atan2 resolves the quadrant
+    azimuth_rad = np.arctan2(
+        -np.sin(ha_rad) * cos_dec,
+        sin_dec * cos_lat - cos_dec * sin_lat * cos_ha
+    )
+    azimuth_deg = np.degrees(azimuth_rad) % 360.0
     
-    return lst
+    return altitude_deg, azimuth_deg
+
+
+def ra_dec_to_alt_az_batch(
+    ra_hours: np.ndarray,
+    dec_degrees: np.ndarray,
+    observer: ObserverLocation,
+    dt: datetime,
+    lst_hours=None,
+    star_trig: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Convert many RA/Dec positions to Altitude/Azimuth in one vectorized pass.
+    
+    Local Sidereal Time only depends on the observer and the time, so it is
+    computed once for the whole batch. Scalars enter the array math as Python
+    floats, so float32 inputs stay float32 throughout.
+    
+    Args:
+        ra_hours: Right Ascension in hours (0-24), shape (N,)
+        dec_degrees: Declination in degrees (-90 to +90), shape (N,)
+        observer: Observer location
+        dt: Observation time
+        lst_hours: Precomputed Local Sidereal Time for (dt, observer), if known;
+            an array of shape (N,) gives each object its own sidereal time
+        star_trig: Precomputed star_trig_terms(ra_hours, dec_degrees), if known;
+            used by the NumPy path (the Numba kernel derives them itself)
+        
+    Returns:
+        Tuple of (altitude, azimuth) arrays in degrees, shape (N,), with the
+        same floating-point dtype as the inputs
+    """
+    if lst_hours is None:
+        lst_hours = calculate_local_sidereal_time(dt, observer.longitude)
+    
+    ra_hours = np.asarray(ra_hours)
+    dec_degrees = np.asarray(dec_degrees)
+    
+    if alt_az_batch is not None and ra_hours.ndim == 1 and dec_degrees.shape == ra_hours.shape:
+        # Numba kernel: one parallel pass, no (N,) temporaries
+        dtype = np.result_type(ra_hours, dec_degrees, np.float32)
+        altitude_deg = np.empty(ra_hours.shape, dtype=dtype)
+        azimuth_deg = np.empty(ra_hours.shape, dtype=dtype)
+        lst_per_object = np.broadcast_to(np.asarray(lst_hours, dtype=np.float64), ra_hours.shape)
+        alt_az_batch(
+            ra_hours, dec_degrees, observer.sin_lat_rad, observer.cos_lat_rad,
+            lst_per_object, altitude_deg, azimuth_deg
+        )
+        return altitude_deg, azimuth_deg
+    
+    if star_trig is None:
+        star_trig = star_trig_terms(ra_hours, dec_degrees)
+    
+    return alt_az_from_star_trig(*star_trig, observer, lst_hours)
 
 
 def ra_dec_to_alt_az(
     ra_hours: float, 
     dec_degrees: float, 
     observer: ObserverLocation, 
-    dt: datetime
+    dt: datetime,
+    lst_hours: Optional[float] = None
 ) -> HorizontalCoordinates:
     """
     Convert Right Ascension/Declination to Altitude/Azimuth.
     
     This is the core coordinate conversion function - pure and predictable.
+    Uses the same formulas as ra_dec_to_alt_az_batch with scalar math calls.
     
     Args:
         ra_hours: Right Ascension in hours (0-24)
         dec_degrees: Declination in degrees (-90 to +90)
         observer: Observer location
         dt: Observation time
+        lst_hours: Precomputed Local Sidereal Time for (dt, observer); callers
+            converting many objects at the same time can pass it to skip the
+            sidereal time calculation
         
     Returns:
         HorizontalCoordinates with altitude and azimuth
     """
-    # Calculate Local Sidereal Time
-    lst_hours = calculate_local_sidereal_time(dt, observer.longitude)
+    if lst_hours is None:
+        lst_hours = calculate_local_sidereal_time(dt, observer.longitude)
+    
+    if ra_dec_to_alt_az_core is not None:
+        altitude_deg, azimuth_deg = ra_dec_to_alt_az_core(
+            ra_hours, dec_degrees, observer.sin_lat_rad, observer.cos_lat_rad, lst_hours
+        )
+        return HorizontalCoordinates(altitude=altitude_deg, azimuth=azimuth_deg)
     
     # Hour Angle = LST - RA
     hour_angle_hours = lst_hours - ra_hours
     hour_angle_degrees = hour_angle_hours * 15.0
     
     # Convert to radians for trigonometry
-    lat_rad = degrees_to_radians(observer.latitude)
     dec_rad = degrees_to_radians(dec_degrees)
     ha_rad = degrees_to_radians(hour_angle_degrees)
     
-    # Calculate altitude
-    sin_alt = (math.sin(dec_rad) * math.sin(lat_rad) + 
-               math.cos(dec_rad) * math.cos(lat_rad) * math.cos(ha_rad))
-    altitude_rad = math.asin(sin_alt)
-    altitude_deg = radians_to_degrees(altitude_rad)
-    
-    # Calculate azimuth
-    cos_az = ((math.sin(dec_rad) - math.sin(altitude_rad) * math.sin(lat_rad)) /
-              (math.cos(altitude_rad) * math.cos(lat_rad)))
+    sin_lat = observer.sin_lat_rad
+    cos_lat = observer.cos_lat_rad
+    sin_dec = math.sin(dec_rad)
+    cos_dec = math.cos(dec_rad)
+    cos_ha = math.cos(ha_rad)
     
-    # Clamp to avoid domain errors
-    cos_az = max(-1.0, min(1.0, cos_az))
-    azimuth_rad = math.acos(cos_az)
-    azimuth_deg = radians_to_degrees(azimuth_rad)
+    # Calculate altitude
+    sin_alt = sin_dec * sin_lat + cos_dec * cos_lat * cos_ha
+    altitude_deg = radians_to_degrees(math.asin(sin_alt))
     
-    # Adjust azimuth quadrant based on hour angle
-    if math.sin(ha_rad) > 0:
-        azimuth_deg = 360.0 - azimuth_deg
+    # Calculate azimuth - atan2 resolves the quadrant without a clamp or branch
+    azimuth_rad = math.atan2(
+        -math.sin(ha_rad) * cos_dec,
+        sin_dec * cos_lat - cos_dec * sin_lat * cos_ha
+    )
+    azimuth_deg = radians_to_degrees(azimuth_rad) % 360.0
     
     return HorizontalCoordinates(
         altitude=max(0.0, altitude_deg),  # Don't show negative altitudes
-        azimuth=azimuth_deg % 360.0
+        azimuth=azimuth_deg
     )
 
 
@@ -149,19 +307,26 @@ def is_object_visible(horizontal_coords: HorizontalCoordinates, min_altitude: fl
     return horizontal_coords.altitude > min_altitude
 
 
+def is_object_visible_array(altitudes: np.ndarray, min_altitude: float = 0.0) -> np.ndarray:
+    """
+    Vectorized visibility test for an array of altitudes.
+    Returns a boolean mask usable to index the matching catalog arrays.
+    """
+    return np.asarray(altitudes) > min_altitude
+
+
 def format_coordinates(ra_hours: float, dec_degrees: float) -> str:
     """
     Format coordinates in human-readable form.
     Pure function for display formatting.
     """
     # Convert RA to hours:minutes
-    ra_h = int(ra_hours)
-    ra_m = int((ra_hours - ra_h) * 60)
+    ra_h, ra_frac = divmod(ra_hours, 1)
+    ra_m = int(ra_frac * 60)
     
     # Convert Dec to degrees:minutes
-    dec_sign = "+" if dec_degrees >= 0 else "-"
-    dec_abs = abs(dec_degrees)
-    dec_d = int(dec_abs)
-    dec_m = int((dec_abs - dec_d) * 60)
+    dec_sign, dec_abs = ("+", dec_degrees) if dec_degrees >= 0 else ("-", -dec_degrees)
+    dec_d, dec_frac = divmod(dec_abs, 1)
+    dec_m = int(dec_frac * 60)
     
-    return f"RA {ra_h:02d}h{ra_m:02d}m, Dec {dec_sign}{dec_d:02d}°{dec_m:02d}'"
+    return f"RA {int(ra_h):02d}h{ra_m:02d}m, Dec {dec_sign}{int(dec_d):02d}°{dec_m:02d}'"
@@ -3,13 +3,52 @@ Advanced visibility calculations for stellar objects.
 Pure functions for rise/set times, transit calculations, and visibility windows.
 """
 
+import heapq
 import math
+import warnings
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional, Tuple
+from functools import lru_cache
+from typing import List, Optional, Tuple, Union
 from dataclasses import dataclass
 
-from ..data.models import StellarObject, ObserverLocation, VisibilityInfo, HorizontalCoordinates
-from .coordinates import ra_dec_to_alt_az, calculate_local_sidereal_time
+import numpy as np
+
+from ..data.models import StellarObject, StellarCatalog, ObserverLocation, VisibilityInfo, HorizontalCoordinates
+from .coordinates import (
+    ra_dec_to_alt_az_batch, calculate_julian_day, datetime_from_jd,
+    calculate_local_sidereal_time, calculate_local_sidereal_time_jd
+)
+
+try:
+    from ._fast import hour_angle_for_altitude_core, rise_set_core, rise_set_batch
+except ImportError:  # Numba not installed - use the pure Python paths below
+    hour_angle_for_altitude_core = None
+    rise_set_core = None
+    rise_set_batch = None
+
+# Status flags returned by the rise/set cores
+_RISES_AND_SETS = 0
+_CIRCUMPOLAR = 1
+_NEVER_VISIBLE = 2
+_NO_HORIZON_CROSSING = 3
+
+# Degrees to radians as one multiply instead of a math.radians call
+_DEG2RAD = math.pi / 180.0
+
+# Horizon used for rise/set, half a degree below for atmospheric refraction
+_HORIZON_ALTITUDE = -0.5
+_SIN_HORIZON_ALTITUDE = math.sin(_HORIZON_ALTITUDE * _DEG2RAD)
+
+# Tolerance in degrees for a maximum altitude exactly on the horizon, so both
+# rise/set cores agree despite rounding in cos(90°)
+_MAX_ALTITUDE_EPSILON = 1e-9
+
+# Sidereal hours elapsed per solar hour (GMST rate of calculate_local_sidereal_time)
+_SIDEREAL_RATE = 24.06570982441908 / 24.0
+
+# Ratio of sidereal to solar day (sidereal day ≈ 23h 56m 4s), converts
+# sidereal hours to solar hours for rise/set/transit offsets
+_SIDEREAL_TO_SOLAR = 23.934469591 / 24.0
 
 
 @dataclass(frozen=True)
@@ -24,6 +63,45 @@ class RiseSetTimes:
     is_never_visible: bool  # Never rises
 
 
+@dataclass(frozen=True)
+class ObservationContext:
+    """
+    Immutable per-(observer, date) quantities shared by every star.
+    Build once with build_observation_context and reuse across a catalog.
+    """
+    latitude: float
+    sin_lat: float
+    cos_lat: float
+    midnight_utc: datetime
+    jd_midnight: float
+    lst_midnight: float  # Local Sidereal Time at midnight, hours
+
+
+def _hour_angle_from_sincos(
+    sin_dec: float,
+    cos_dec: float,
+    sin_lat: float,
+    cos_lat: float,
+    sin_alt: float
+) -> Optional[float]:
+    """
+    Hour angle in degrees at which an object reaches an altitude, from
+    already-computed sines/cosines of declination, latitude and altitude.
+    Returns None if the altitude is never crossed.
+    """
+    denominator = cos_dec * cos_lat
+    if denominator == 0.0:
+        return None
+    
+    cos_ha = (sin_alt - sin_dec * sin_lat) / denominator
+    
+    # cos_ha < -1: circumpolar at this altitude; cos_ha > 1: never reaches it
+    if cos_ha < -1.0 or cos_ha > 1.0:
+        return None
+    
+    return math.degrees(math.acos(cos_ha))
+
+
 def calculate_hour_angle_for_altitude(
     dec_degrees: float, 
     observer_lat: float, 
@@ -40,31 +118,43 @@ def calculate_hour_angle_for_altitude(
     Returns:
         Hour angle in degrees, or None if never reaches altitude
     """
-    # Convert to radians
-    dec_rad = math.radians(dec_degrees)
-    lat_rad = math.radians(observer_lat)
-    alt_rad = math.radians(altitude)
-    
-    # Calculate hour angle using spherical trigonometry
-    try:
-        cos_ha = (math.sin(alt_rad) - math.sin(dec_rad) * math.sin(lat_rad)) / (
-            math.cos(dec_rad) * math.cos(lat_rad)
-        )
-        
-        # Check if object can reach this altitude
-        if cos_ha < -1.0:
-            # Object is circumpolar at this altitude
-            return None
-        elif cos_ha > 1.0:
-            # Object never reaches this altitude
-            return None
-        else:
-            # Calculate hour angle
-            ha_rad = math.acos(cos_ha)
-            return math.degrees(ha_rad)
-            
-    except (ValueError, ZeroDivisionError):
-        return None
+    if hour_angle_for_altitude_core is not None:
+        hour_angle_deg = hour_angle_for_altitude_core(dec_degrees, observer_lat, altitude)
+        return hour_angle_deg if hour_angle_deg >= 0.0 else None
+    
+    dec_rad = dec_degrees * _DEG2RAD
+    lat_rad = observer_lat * _DEG2RAD
+    return _hour_angle_from_sincos(
+        math.sin(dec_rad), math.cos(dec_rad),
+        math.sin(lat_rad), math.cos(lat_rad),
+        math.sin(altitude * _DEG2RAD)
+    )
+
+
+def _midnight_of(date) -> datetime:
+    """Midnight at the start of a date (datetime or date object)."""
+    if hasattr(date, 'hour'):
+        # It's a datetime object
+        return date.replace(hour=0, minute=0, second=0, microsecond=0)
+    # It's a date object
+    return datetime.combine(date, datetime.min.time())
+
+
+@lru_cache(maxsize=1024)
+def _lst_at_midnight(longitude: float, date_ordinal: int) -> float:
+    """
+    Local Sidereal Time in hours at 00:00 UTC of a date, memoized.
+    Keyed on the date ordinal rather than a datetime for cheap hashing.
+    """
+    return calculate_local_sidereal_time(datetime.fromordinal(date_ordinal), longitude)
+
+
+def _lst_for_midnight(midnight: datetime, longitude: float) -> float:
+    """LST at a midnight, through the cache when the midnight is in UTC."""
+    if midnight.tzinfo is None or midnight.tzinfo is timezone.utc:
+        # Quantize longitude so float noise doesn't defeat the cache
+        return _lst_at_midnight(round(longitude, 6), midnight.toordinal())
+    return calculate_local_sidereal_time(midnight, longitude)
 
 
 def calculate_transit_time(ra_hours: float, date, longitude: float) -> datetime:
@@ -80,67 +170,108 @@ def calculate_transit_time(ra_hours: float, date, longitude: float) -> datetime:
         UTC datetime of transit
     """
     # Calculate Local Sidereal Time at midnight
-    if hasattr(date, 'hour'):
-        # It's a datetime object
-        midnight_utc = date.replace(hour=0, minute=0, second=0, microsecond=0)
-    else:
-        # It's a date object
-        midnight_utc = datetime.combine(date, datetime.min.time())
-    lst_midnight = calculate_local_sidereal_time(midnight_utc, longitude)
+    midnight_utc = _midnight_of(date)
+    lst_midnight = _lst_for_midnight(midnight_utc, longitude)
     
     # Transit occurs when LST = RA
-    # So we need LST to advance from midnight value to RA
-    hours_to_transit = ra_hours - lst_midnight
-    
-    # Handle day boundary crossing
-    if hours_to_transit < 0:
-        hours_to_transit += 24
-    elif hours_to_transit >= 24:
-        hours_to_transit -= 24
+    # So we need LST to advance from midnight value to RA; the float modulo
+    # handles the day boundary crossing without branches
+    hours_to_transit = (ra_hours - lst_midnight) % 24.0
     
-    # Convert sidereal hours to solar hours (sidereal day ≈ 23h 56m 4s)
-    sidereal_to_solar = 23.934469591 / 24.0  # Ratio of sidereal to solar day
-    solar_hours_to_transit = hours_to_transit * sidereal_to_solar
+    # Convert sidereal hours to solar hours
+    solar_hours_to_transit = hours_to_transit * _SIDEREAL_TO_SOLAR
     
     transit_time = midnight_utc + timedelta(hours=solar_hours_to_transit)
     return transit_time
 
 
-def calculate_rise_set_times(
-    star: StellarObject, 
-    observer: ObserverLocation, 
-    date: datetime
-) -> RiseSetTimes:
+def build_observation_context(observer: ObserverLocation, date) -> ObservationContext:
     """
-    Calculate rise and set times for a stellar object.
-    Pure function using spherical astronomy.
+    Pure function to precompute the observer/date quantities of rise/set math.
     
     Args:
-        star: Stellar object
         observer: Observer location
-        date: Date for calculation (time component ignored)
+        date: Date for calculation (datetime or date object, time ignored)
         
     Returns:
-        RiseSetTimes with all timing information
+        ObservationContext for calculate_rise_set_times_with_ctx
     """
-    # Calculate maximum altitude (at transit)
-    # Max altitude occurs when hour angle = 0
-    lat_rad = math.radians(observer.latitude)
-    dec_rad = math.radians(star.dec_degrees)
+    midnight_utc = _midnight_of(date)
+    jd_midnight = calculate_julian_day(midnight_utc)
     
-    max_altitude_rad = math.asin(
-        math.sin(dec_rad) * math.sin(lat_rad) + 
-        math.cos(dec_rad) * math.cos(lat_rad)
+    return ObservationContext(
+        latitude=observer.latitude,
+        sin_lat=observer.sin_lat_rad,
+        cos_lat=observer.cos_lat_rad,
+        midnight_utc=midnight_utc,
+        jd_midnight=jd_midnight,
+        lst_midnight=_lst_for_midnight(midnight_utc, observer.longitude)
     )
+
+
+def _rise_set_core(
+    ra_hours: float,
+    dec_degrees: float,
+    observer_lat: float,
+    sin_lat: float,
+    cos_lat: float,
+    lst_midnight: float
+) -> Tuple[float, float, float, float, int]:
+    """
+    Pure Python twin of the compiled rise_set_core kernel.
+    
+    Returns:
+        (rise_offset, set_offset, transit_offset, max_altitude, flags) with
+        offsets in solar hours after midnight and flags one of the
+        _RISES_AND_SETS / _CIRCUMPOLAR / _NEVER_VISIBLE / _NO_HORIZON_CROSSING
+    """
+    dec_rad = dec_degrees * _DEG2RAD
+    sin_dec = math.sin(dec_rad)
+    cos_dec = math.cos(dec_rad)
+    
+    # Calculate maximum altitude (at transit)
+    # Max altitude occurs when hour angle = 0
+    max_altitude_rad = math.asin(min(1.0, sin_dec * sin_lat + cos_dec * cos_lat))
     max_altitude = math.degrees(max_altitude_rad)
     
     # Check for special cases
-    is_circumpolar = (star.dec_degrees + observer.latitude) > 90
-    is_never_visible = (star.dec_degrees + observer.latitude) < -90 or max_altitude < 0
+    if (dec_degrees + observer_lat) < -90 or max_altitude < -_MAX_ALTITUDE_EPSILON:
+        return 0.0, 0.0, 0.0, max_altitude, _NEVER_VISIBLE
+    
+    # Transit occurs when LST = RA
+    hours_to_transit = (ra_hours - lst_midnight) % 24.0
+    
+    # Convert sidereal hours to solar hours
+    transit_offset = hours_to_transit * _SIDEREAL_TO_SOLAR
+    
+    if (dec_degrees + observer_lat) > 90:
+        return 0.0, 0.0, transit_offset, max_altitude, _CIRCUMPOLAR
     
-    if is_never_visible:
+    # Calculate hour angle for horizon crossing (accounting for refraction)
+    hour_angle_deg = _hour_angle_from_sincos(
+        sin_dec, cos_dec, sin_lat, cos_lat, _SIN_HORIZON_ALTITUDE
+    )
+    if hour_angle_deg is None:
+        return 0.0, 0.0, transit_offset, max_altitude, _NO_HORIZON_CROSSING
+    
+    # Convert hour angle to time difference from transit (15° per hour)
+    half_arc = hour_angle_deg / 15.0 * _SIDEREAL_TO_SOLAR
+    return transit_offset - half_arc, transit_offset + half_arc, transit_offset, max_altitude, _RISES_AND_SETS
+
+
+def _rise_set_times_from_offsets(
+    name: str,
+    rise_offset: float,
+    set_offset: float,
+    transit_offset: float,
+    max_altitude: float,
+    flags: int,
+    midnight_utc: datetime
+) -> RiseSetTimes:
+    """Rebuild RiseSetTimes from a rise/set core's float results."""
+    if flags == _NEVER_VISIBLE:
         return RiseSetTimes(
-            object_name=star.name,
+            object_name=name,
             rise_time=None,
             set_time=None,
             transit_time=None,
@@ -149,53 +280,27 @@ def calculate_rise_set_times(
             is_never_visible=True
         )
     
-    # Calculate transit time
-    transit_time = calculate_transit_time(star.ra_hours, date, observer.longitude)
-    
-    if is_circumpolar:
-        return RiseSetTimes(
-            object_name=star.name,
-            rise_time=None,  # Always visible
-            set_time=None,   # Never sets
-            transit_time=transit_time,
-            max_altitude=max_altitude,
-            is_circumpolar=True,
-            is_never_visible=False
-        )
-    
-    # Calculate hour angle for horizon crossing (accounting for refraction)
-    # Use -0.83° to account for atmospheric refraction and sun's diameter
-    horizon_altitude = -0.5  # A bit below horizon for stars
-    hour_angle_deg = calculate_hour_angle_for_altitude(
-        star.dec_degrees, observer.latitude, horizon_altitude
-    )
+    transit_time = midnight_utc + timedelta(hours=transit_offset)
     
-    if hour_angle_deg is None:
-        # Shouldn't happen given our earlier checks, but handle gracefully
+    if flags != _RISES_AND_SETS:
+        # Circumpolar: always visible, never sets. No horizon crossing
+        # shouldn't happen given the earlier checks, but handle gracefully
         return RiseSetTimes(
-            object_name=star.name,
+            object_name=name,
             rise_time=None,
             set_time=None,
             transit_time=transit_time,
             max_altitude=max_altitude,
-            is_circumpolar=is_circumpolar,
-            is_never_visible=is_never_visible
+            is_circumpolar=flags == _CIRCUMPOLAR,
+            is_never_visible=False
         )
     
-    # Convert hour angle to time difference from transit
-    hour_angle_hours = hour_angle_deg / 15.0  # 15° per hour
-    sidereal_to_solar = 23.934469591 / 24.0
-    
-    time_before_transit = timedelta(hours=hour_angle_hours * sidereal_to_solar)
-    time_after_transit = timedelta(hours=hour_angle_hours * sidereal_to_solar)
-    
-    rise_time = transit_time - time_before_transit
-    set_time = transit_time + time_after_transit
-    
+    # Rise and set are symmetric about transit - one shared delta
+    half_arc = timedelta(hours=set_offset - transit_offset)
     return RiseSetTimes(
-        object_name=star.name,
-        rise_time=rise_time,
-        set_time=set_time,
+        object_name=name,
+        rise_time=transit_time - half_arc,
+        set_time=transit_time + half_arc,
         transit_time=transit_time,
         max_altitude=max_altitude,
         is_circumpolar=False,
@@ -203,126 +308,287 @@ def calculate_rise_set_times(
     )
 
 
+def calculate_rise_set_times_with_ctx(star: StellarObject, ctx: ObservationContext) -> RiseSetTimes:
+    """
+    Calculate rise and set times for a stellar object against a prebuilt
+    observation context - the fast path for many stars on one date.
+    
+    Args:
+        star: Stellar object
+        ctx: Context from build_observation_context
+        
+    Returns:
+        RiseSetTimes with all timing information
+    """
+    core = rise_set_core if rise_set_core is not None else _rise_set_core
+    
+    # Only floats cross into the core; datetimes are rebuilt here
+    return _rise_set_times_from_offsets(
+        star.name,
+        *core(
+            star.ra_hours, star.dec_degrees,
+            ctx.latitude, ctx.sin_lat, ctx.cos_lat, ctx.lst_midnight
+        ),
+        ctx.midnight_utc
+    )
+
+
+def calculate_rise_set_times_batch(
+    catalog: StellarCatalog,
+    ctx: ObservationContext
+) -> List[RiseSetTimes]:
+    """
+    Calculate rise and set times for every object of a catalog at once.
+    With Numba the per-object math runs in parallel across cores.
+    
+    Args:
+        catalog: Objects as a struct-of-arrays catalog
+        ctx: Context from build_observation_context
+        
+    Returns:
+        RiseSetTimes per object, in catalog order
+    """
+    count = len(catalog)
+    rise_offsets = np.empty(count)
+    set_offsets = np.empty(count)
+    transit_offsets = np.empty(count)
+    max_altitudes = np.empty(count)
+    flags = np.empty(count, dtype=np.int8)
+    
+    if rise_set_batch is not None:
+        rise_set_batch(
+            catalog.ra_hours, catalog.dec_degrees,
+            ctx.latitude, ctx.sin_lat, ctx.cos_lat, ctx.lst_midnight,
+            rise_offsets, set_offsets, transit_offsets, max_altitudes, flags
+        )
+    else:
+        for i in range(count):
+            (rise_offsets[i], set_offsets[i], transit_offsets[i],
+             max_altitudes[i], flags[i]) = _rise_set_core(
+                float(catalog.ra_hours[i]), float(catalog.dec_degrees[i]),
+                ctx.latitude, ctx.sin_lat, ctx.cos_lat, ctx.lst_midnight
+            )
+    
+    midnight_utc = ctx.midnight_utc
+    return [
+        _rise_set_times_from_offsets(*fields, midnight_utc)
+        for fields in zip(
+            catalog.names, rise_offsets.tolist(), set_offsets.tolist(),
+            transit_offsets.tolist(), max_altitudes.tolist(), flags.tolist()
+        )
+    ]
+
+
+def calculate_rise_set_times(
+    star: StellarObject, 
+    observer: ObserverLocation, 
+    date: datetime
+) -> RiseSetTimes:
+    """
+    Calculate rise and set times for a stellar object.
+    Pure function using spherical astronomy.
+    
+    Args:
+        star: Stellar object
+        observer: Observer location
+        date: Date for calculation (time component ignored)
+        
+    Returns:
+        RiseSetTimes with all timing information
+    """
+    return calculate_rise_set_times_with_ctx(star, build_observation_context(observer, date))
+
+
+def _as_catalog(stars: Union[List[StellarObject], StellarCatalog]) -> StellarCatalog:
+    """Objects as a StellarCatalog, converting a list of stars once."""
+    if isinstance(stars, StellarCatalog):
+        return stars
+    return StellarCatalog.from_stars(stars)
+
+
+def _highest_first(
+    altitudes: np.ndarray,
+    min_altitude: float,
+    max_results: Optional[int]
+) -> np.ndarray:
+    """
+    Indices of altitudes above min_altitude, highest first, ties in input
+    order. A small max_results takes the top k with a heap in O(N log k)
+    instead of sorting every visible object.
+    """
+    visible = np.flatnonzero(altitudes > min_altitude)
+    
+    if max_results is not None and max_results < len(visible):
+        key = altitudes.tolist().__getitem__
+        return np.array(heapq.nlargest(max_results, visible.tolist(), key=key), dtype=np.intp)
+    
+    # Stable sort on the negated altitudes keeps input order for ties
+    return visible[np.argsort(-altitudes[visible], kind='stable')]
+
+
 def calculate_visibility_for_time_range(
-    stars: List[StellarObject],
+    stars: Union[List[StellarObject], StellarCatalog],
     observer: ObserverLocation,
     start_time: datetime,
     end_time: datetime,
     min_altitude: float = 0.0,
-    time_step_minutes: int = 60
+    time_step_minutes: Optional[int] = None,
+    max_results: Optional[int] = None
 ) -> List[VisibilityInfo]:
     """
     Calculate visibility for multiple objects over a time range.
-    Pure function that samples visibility at regular intervals.
+    Pure function solving for each object's highest point in closed form.
+    
+    Altitude falls monotonically with |hour angle|, so an object is highest
+    at transit when the transit falls inside the range, and otherwise at
+    whichever end of the range is closer to transit. It is visible during
+    the range exactly when it clears min_altitude at that moment.
     
     Args:
-        stars: List of stellar objects
+        stars: Stellar objects, as a list or a StellarCatalog
         observer: Observer location
         start_time: Start of time range
         end_time: End of time range
         min_altitude: Minimum altitude for visibility
-        time_step_minutes: Time step for sampling
+        time_step_minutes: Deprecated and ignored; the result no longer
+            depends on a sampling step
+        max_results: Keep only this many of the highest objects
         
     Returns:
         List of VisibilityInfo for objects visible during the range
     """
-    visible_objects = []
-    
-    for star in stars:
-        # Sample visibility at several time points
-        current_time = start_time
-        max_altitude_seen = -90.0
-        best_time = start_time
-        ever_visible = False
-        
-        while current_time <= end_time:
-            horizontal = ra_dec_to_alt_az(
-                star.ra_hours,
-                star.dec_degrees,
-                observer,
-                current_time
-            )
-            
-            if horizontal.altitude > min_altitude:
-                ever_visible = True
-                
-            if horizontal.altitude > max_altitude_seen:
-                max_altitude_seen = horizontal.altitude
-                best_time = current_time
-                
-            current_time += timedelta(minutes=time_step_minutes)
-        
-        if ever_visible:
-            # Calculate final position for the best time
-            best_horizontal = ra_dec_to_alt_az(
-                star.ra_hours,
-                star.dec_degrees,
-                observer,
-                best_time
-            )
-            
-            # Calculate rise/set times for additional info
-            rise_set = calculate_rise_set_times(star, observer, start_time.date())
-            
-            visible_objects.append(VisibilityInfo(
-                object_name=star.name,
-                is_visible=True,
-                altitude=best_horizontal.altitude,
-                azimuth=best_horizontal.azimuth,
-                rise_time=rise_set.rise_time,
-                set_time=rise_set.set_time,
-                max_altitude_time=best_time
-            ))
-    
-    # Sort by maximum altitude (brightest/highest first)
-    return sorted(visible_objects, key=lambda x: x.altitude, reverse=True)
+    if time_step_minutes is not None:
+        warnings.warn(
+            "time_step_minutes is ignored: visibility is solved in closed form, "
+            "not sampled. The parameter will be removed in a future release.",
+            DeprecationWarning,
+            stacklevel=2
+        )
+    
+    if not len(stars) or end_time < start_time:
+        return []
+    
+    # Work in Julian Days; only the reported best times become datetimes
+    jd_start = calculate_julian_day(start_time)
+    jd_end = calculate_julian_day(end_time)
+    
+    # Range length in sidereal hours
+    window_sidereal_hours = (jd_end - jd_start) * 24.0 * _SIDEREAL_RATE
+    lst_start = calculate_local_sidereal_time_jd(jd_start, observer.longitude)
+    
+    catalog = _as_catalog(stars)
+    
+    # Early reject: nothing climbs above its transit altitude 90° - |dec - lat|
+    candidates = np.flatnonzero(
+        90.0 - np.abs(catalog.dec_degrees - observer.latitude) > min_altitude
+    )
+    ra_hours = catalog.ra_hours[candidates]
+    dec_degrees = catalog.dec_degrees[candidates]
+    
+    # Sidereal hours from the start of the range to the next transit (HA = 0)
+    to_transit = (ra_hours - lst_start) % 24.0
+    
+    # Otherwise compare |HA| at both ends; ties go to the start of the range
+    ha_at_start = np.minimum(to_transit, 24.0 - to_transit)
+    past_end = to_transit - window_sidereal_hours
+    ha_at_end = np.minimum(past_end, 24.0 - past_end)
+    best_offset = np.where(
+        to_transit <= window_sidereal_hours,
+        to_transit,
+        np.where(ha_at_end < ha_at_start, window_sidereal_hours, 0.0)
+    )
+    
+    # Position of every object at its own best moment
+    altitudes, azimuths = ra_dec_to_alt_az_batch(
+        ra_hours, dec_degrees, observer, start_time, (lst_start + best_offset) % 24.0,
+        star_trig=(catalog.ra_rad[candidates], catalog.sin_dec[candidates], catalog.cos_dec[candidates])
+    )
+    best_jd = jd_start + best_offset / (24.0 * _SIDEREAL_RATE)
+    
+    ctx = build_observation_context(observer, start_time.date())
+    
+    # Visible objects by maximum altitude (brightest/highest first)
+    visible = _highest_first(altitudes, min_altitude, max_results)
+    
+    # Rise/set times for additional info, then emit results in one pass
+    visible_catalog = catalog.take(candidates[visible])
+    rise_sets = calculate_rise_set_times_batch(visible_catalog, ctx)
+    
+    visible_objects = [
+        VisibilityInfo(
+            object_name=name,
+            is_visible=True,
+            altitude=altitude,
+            azimuth=azimuth,
+            rise_time=rise_set.rise_time,
+            set_time=rise_set.set_time,
+            max_altitude_time=datetime_from_jd(jd, start_time.tzinfo)
+        )
+        for name, rise_set, altitude, azimuth, jd in zip(
+            visible_catalog.names, rise_sets,
+            altitudes[visible].tolist(), azimuths[visible].tolist(), best_jd[visible].tolist()
+        )
+    ]
+    
+    return visible_objects
 
 
 def calculate_current_visibility(
-    stars: List[StellarObject],
+    stars: Union[List[StellarObject], StellarCatalog],
     observer: ObserverLocation,
     observation_time: datetime,
-    min_altitude: float = 0.0
+    min_altitude: float = 0.0,
+    max_results: Optional[int] = None
 ) -> List[VisibilityInfo]:
     """
     Calculate current visibility for a list of stars.
     Pure function for real-time visibility checking.
     
     Args:
-        stars: List of stellar objects
+        stars: Stellar objects, as a list or a StellarCatalog
         observer: Observer location
         observation_time: Current time
         min_altitude: Minimum altitude for visibility
+        max_results: Keep only this many of the highest objects
         
     Returns:
         List of VisibilityInfo for currently visible objects
     """
-    visible_objects = []
-    
-    for star in stars:
-        horizontal = ra_dec_to_alt_az(
-            star.ra_hours,
-            star.dec_degrees,
-            observer,
-            observation_time
+    if not len(stars):
+        return []
+    
+    # Same time and observer for every star - one vectorized conversion
+    catalog = _as_catalog(stars)
+    altitudes, azimuths = ra_dec_to_alt_az_batch(
+        catalog.ra_hours, catalog.dec_degrees, observer, observation_time,
+        star_trig=(catalog.ra_rad, catalog.sin_dec, catalog.cos_dec)
+    )
+    
+    # Rise/set times for additional context, only for the visible subset
+    ctx = build_observation_context(observer, observation_time.date())
+    
+    # Visible objects by altitude (highest first)
+    visible = _highest_first(altitudes, min_altitude, max_results)
+    visible_catalog = catalog.take(visible)
+    rise_sets = calculate_rise_set_times_batch(visible_catalog, ctx)
+    
+    visible_objects = [
+        VisibilityInfo(
+            object_name=name,
+            is_visible=True,
+            altitude=altitude,
+            azimuth=azimuth,
+            rise_time=rise_set.rise_time,
+            set_time=rise_set.set_time,
+            max_altitude_time=rise_set.transit_time
         )
-        
-        if horizontal.altitude > min_altitude:
-            # Calculate rise/set times for additional context
-            rise_set = calculate_rise_set_times(star, observer, observation_time.date())
-            
-            visible_objects.append(VisibilityInfo(
-                object_name=star.name,
-                is_visible=True,
-                altitude=horizontal.altitude,
-                azimuth=horizontal.azimuth,
-                rise_time=rise_set.rise_time,
-                set_time=rise_set.set_time,
-                max_altitude_time=rise_set.transit_time
-            ))
-    
-    # Sort by altitude (highest first)
-    return sorted(visible_objects, key=lambda x: x.altitude, reverse=True)
+        for name, rise_set, altitude, azimuth in zip(
+            visible_catalog.names, rise_sets,
+            altitudes[visible].tolist(), azimuths[visible].tolist()
+        )
+    ]
+    
+    return visible_objects
 
 
 def filter_visible_objects(
@@ -341,11 +607,15 @@ def filter_visible_objects(
     Returns:
         Filtered and limited visibility information
     """
-    # Filter by altitude
-    filtered = [info for info in visibility_info if info.altitude >= min_altitude]
+    # Filter by altitude with one vectorized comparison
+    altitudes = np.fromiter(
+        (info.altitude for info in visibility_info),
+        dtype=np.float64, count=len(visibility_info)
+    )
+    indices = np.flatnonzero(altitudes >= min_altitude)
     
     # Limit results if requested
     if max_results is not None:
-        filtered = filtered[:max_results]
+        indices = indices[:max_results]
     
-    return filtered
+    return [visibility_info[i] for i in indices]
@@ -4,81 +4,173 @@ Showcases functional programming with real astronomical data and flexible locati
 """
 
 import click
+import re
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from rich.console import Console
-from rich.table import Table
-from rich.progress import Progress
-from typing import List, Optional
-
-from ..data.models import StellarObject, ObserverLocation, SearchCriteria
-from ..data.catalog_processor import (
-    process_star_catalog, apply_filters, sort_by_brightness, 
-    sort_by_name, sort_by_constellation
-)
-from ..data.location_parser import parse_location_input
-from ..calculations.coordinates import ra_dec_to_alt_az, format_coordinates
-from ..calculations.visibility import (
-    calculate_current_visibility, calculate_visibility_for_time_range,
-    calculate_rise_set_times, filter_visible_objects
-)
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+# Everything else is imported inside the commands that use it, so that
+# `astro --help` and light commands skip NumPy, Numba and the catalog code
+if TYPE_CHECKING:
+    from ..data.models import StellarObject, StellarCatalog, ObserverLocation
 
 console = Console()
 
 # Global catalog cache for performance
-_star_catalog: Optional[List[StellarObject]] = None
+_star_catalog: "Optional[List[StellarObject]]" = None
+
+# CSV the cached catalog was loaded from
+_star_catalog_path: Optional[Path] = None
+
+# Struct-of-arrays view of the cached catalog, loaded on first use
+_star_catalog_soa: "Optional[StellarCatalog]" = None
+
+# --time-range values like "20:00-06:00"
+_TIME_RANGE_RE = re.compile(r'\s*(\d{1,2}):(\d{2})\s*-\s*(\d{1,2}):(\d{2})\s*')
+
+# Table layouts as (header, style, justify) column specs
+PROPERTY_COLUMNS = (
+    ("Property", "cyan", "left"),
+    ("Value", "magenta", "left"),
+)
+SEARCH_COLUMNS = (
+    ("Star", "cyan", "left"),
+    ("Constellation", "green", "left"),
+    ("Magnitude", "yellow", "right"),
+    ("Spectral Type", "blue", "left"),
+    ("Coordinates", "magenta", "left"),
+)
+SEARCH_POSITION_COLUMNS = (
+    ("Altitude", "red", "right"),
+    ("Azimuth", "red", "right"),
+)
+VISIBLE_COLUMNS = (
+    ("Star", "cyan", "left"),
+    ("Altitude", "yellow", "right"),
+    ("Azimuth", "blue", "right"),
+    ("Rise Time", "green", "left"),
+    ("Set Time", "red", "left"),
+    ("Transit", "magenta", "left"),
+)
+DEMO_COLUMNS = (
+    ("Star", "cyan", "left"),
+    ("Constellation", "green", "left"),
+    ("Magnitude", "yellow", "right"),
+    ("Spectral Type", "blue", "left"),
+    ("Altitude", "magenta", "right"),
+    ("Azimuth", "red", "right"),
+    ("Visible?", "white", "left"),
+)
+
+# Catalogs in order of preference
+CATALOG_PATHS = (
+    Path("data/comprehensive_star_catalog.csv"),
+    Path("data/bright_stars_catalog.csv")
+)
 
 
-def load_star_catalog() -> List[StellarObject]:
+def print_catalog_errors(errors: List[str]):
+    """Report a catalog that yielded no stars, with its first few errors."""
+    console.print(f"[red]Error loading catalog:[/red]")
+    for error in errors[:5]:  # Show first 5 errors
+        console.print(f"  • {error}")
+    if len(errors) > 5:
+        console.print(f"  • ... and {len(errors) - 5} more errors")
+
+
+def load_star_catalog() -> "List[StellarObject]":
     """Load star catalog with caching for performance."""
-    global _star_catalog
+    global _star_catalog, _star_catalog_path
     
     if _star_catalog is not None:
         return _star_catalog
     
-    # Try comprehensive catalog first, fall back to basic
-    catalog_paths = [
-        Path("data/comprehensive_star_catalog.csv"),
-        Path("data/bright_stars_catalog.csv")
-    ]
+    from ..data.catalog_processor import (
+        process_star_catalog, load_catalog_cache, save_catalog_cache
+    )
     
-    for catalog_path in catalog_paths:
+    # Try comprehensive catalog first, fall back to basic
+    for catalog_path in CATALOG_PATHS:
         if catalog_path.exists():
-            with Progress() as progress:
-                task = progress.add_task("Loading star catalog...", total=100)
-                
-                result = process_star_catalog(str(catalog_path))
-                progress.update(task, completed=50)
-                
-                if not result.success:
-                    console.print(f"[red]Error loading catalog:[/red]")
-                    for error in result.errors[:5]:  # Show first 5 errors
-                        console.print(f"  • {error}")
-                    if len(result.errors) > 5:
-                        console.print(f"  • ... and {len(result.errors) - 5} more errors")
-                    continue
-                
-                progress.update(task, completed=100)
-                
-                _star_catalog = result.data
-                console.print(f"[green]✅ Loaded {result.valid_records} stars from {catalog_path.name}[/green]")
-                
-                if result.errors:
-                    console.print(f"[yellow]⚠️  {len(result.errors)} records had issues[/yellow]")
-                
-                return _star_catalog
+            # A one-line spinner, drawn only on a terminal
+            with console.status("Loading star catalog..."):
+                # Reuse the pre-parsed binary copy while it matches the CSV
+                result = load_catalog_cache(str(catalog_path))
+                if result is None:
+                    result = process_star_catalog(str(catalog_path))
+                    save_catalog_cache(str(catalog_path), result)
+            
+            if not result.success:
+                print_catalog_errors(result.errors)
+                continue
+            
+            _star_catalog = result.data
+            _star_catalog_path = catalog_path
+            console.print(f"[green]✅ Loaded {result.valid_records} stars from {catalog_path.name}[/green]")
+            
+            if result.errors:
+                console.print(f"[yellow]⚠️  {len(result.errors)} records had issues[/yellow]")
+            
+            return _star_catalog
     
     console.print("[red]Error: No star catalog found![/red]")
     console.print("Run: [cyan]python create_comprehensive_catalog.py[/cyan] to create the catalog")
     return []
 
 
-def parse_observer_location(location_str: Optional[str]) -> ObserverLocation:
-    """Parse location string or return default Denver location."""
+def load_star_catalog_soa() -> "StellarCatalog":
+    """
+    load_star_catalog() as a StellarCatalog, cached like the catalog.
+    Both read the same binary cache, so index i of every column describes
+    load_star_catalog()[i].
+    """
+    global _star_catalog_soa
+    
+    if _star_catalog_soa is not None:
+        return _star_catalog_soa
+    
+    from ..data.catalog_processor import load_catalog_soa
+    from ..data.models import StellarCatalog
+    
+    if not load_star_catalog():
+        _star_catalog_soa = StellarCatalog.from_stars([])
+    else:
+        _star_catalog_soa = StellarCatalog.from_columns(load_catalog_soa(str(_star_catalog_path)))
+    return _star_catalog_soa
+
+
+def make_table(title: str, columns):
+    """Build an empty rich Table from (header, style, justify) column specs."""
+    from rich.table import Table
+    
+    table = Table(title=title)
+    for header, style, justify in columns:
+        table.add_column(header, style=style, justify=justify)
+    return table
+
+
+@lru_cache(maxsize=32)
+def _parse_location_cached(location_str: str):
+    """parse_location_input memoized per string; its result is immutable."""
+    from ..data.location_parser import parse_location_input
+    
+    return parse_location_input(location_str)
+
+
+def parse_observer_location(location_str: Optional[str]) -> "ObserverLocation":
+    """
+    Parse location string or return default Denver location.
+    Call once per command and reuse the observer; repeated strings in one
+    process hit the parse cache, while warnings are still printed each time.
+    """
+    from ..data.models import ObserverLocation
+    
     if not location_str:
         return ObserverLocation(39.7392, -104.9903, "Denver, CO (default)")
     
-    result = parse_location_input(location_str)
+    result = _parse_location_cached(location_str)
     if result.success:
         return result.location
     else:
@@ -112,6 +204,7 @@ def location(location):
         parse_location_input, validate_location_for_astronomy, 
         get_location_info, suggest_similar_cities
     )
+    from ..calculations.visibility import calculate_current_visibility
     
     # Parse the location
     result = parse_location_input(location)
@@ -140,9 +233,7 @@ def location(location):
     location_info = get_location_info(observer)
     
     # Create detailed information table
-    table = Table(title=f"Location Information: {observer.name}")
-    table.add_column("Property", style="cyan")
-    table.add_column("Value", style="magenta")
+    table = make_table(f"Location Information: {observer.name}", PROPERTY_COLUMNS)
     
     table.add_row("Location Name", observer.name)
     table.add_row("Latitude (Decimal)", f"{observer.latitude:.6f}°")
@@ -192,49 +283,56 @@ def search(mag_limit, min_mag, constellation, spectral_type, sort_by, limit,
            visible_now, location, min_altitude):
     """Search the star catalog with powerful filtering options."""
     
+    import numpy as np
+    from ..calculations.coordinates import (
+        ra_dec_to_alt_az_batch, gmst_from_datetime, local_sidereal_time_from_gmst,
+        format_coordinates
+    )
+    
     # Load the star catalog
     stars = load_star_catalog()
     if not stars:
         return
     
-    # Parse spectral types if provided
-    spectral_types_list = None
+    catalog = load_star_catalog_soa()
+    
+    # Each filter is one vectorized pass returning a sub-catalog
+    results = catalog.filter_by_magnitude(mag_limit, min_mag).filter_by_constellation(constellation)
     if spectral_type:
-        spectral_types_list = [t.strip().upper() for t in spectral_type.split(',')]
-    
-    # Apply filters using functional composition
-    filtered_stars = apply_filters(
-        stars=stars,
-        max_magnitude=mag_limit,
-        min_magnitude=min_mag,
-        constellation=constellation,
-        spectral_types=spectral_types_list
-    )
+        # Matches the first character of each type (O, B, A, F, G, K, M)
+        results = results.filter_by_spectral_type([t.strip() for t in spectral_type.split(',')])
     
     # Apply visibility filter if requested
     if visible_now:
         observer = parse_observer_location(location)
+        
+        # One clock read and one sidereal time for every star
         current_time = datetime.now()
+        lst_hours = local_sidereal_time_from_gmst(gmst_from_datetime(current_time), observer.longitude)
         
-        # Calculate current visibility
-        visibility_info = calculate_current_visibility(
-            filtered_stars, observer, current_time, min_altitude
+        altitudes, _ = ra_dec_to_alt_az_batch(
+            results.ra_hours, results.dec_degrees, observer, current_time, lst_hours,
+            star_trig=(results.ra_rad, results.sin_dec, results.cos_dec)
         )
-        
-        # Extract the stellar objects that are visible
-        visible_star_names = {info.object_name for info in visibility_info}
-        filtered_stars = [star for star in filtered_stars if star.name in visible_star_names]
+        results = results.take(np.flatnonzero(altitudes > min_altitude))
     
-    # Sort results
+    # Sort with the limit, so only the rows that can make the cut are sorted;
+    # sorts are stable, so filtering first gives the same order
     if sort_by == 'brightness':
-        filtered_stars = sort_by_brightness(filtered_stars)
+        results = results.sort_by_brightness(limit)
     elif sort_by == 'name':
-        filtered_stars = sort_by_name(filtered_stars)
-    elif sort_by == 'constellation':
-        filtered_stars = sort_by_constellation(filtered_stars)
+        results = results.sort_by_name(limit)
+    else:
+        results = results.sort_by_constellation(limit)
     
-    # Limit results
-    filtered_stars = filtered_stars[:limit]
+    if visible_now:
+        # Positions for the table, only for the rows shown
+        altitudes, azimuths = ra_dec_to_alt_az_batch(
+            results.ra_hours, results.dec_degrees, observer, current_time, lst_hours,
+            star_trig=(results.ra_rad, results.sin_dec, results.cos_dec)
+        )
+    
+    filtered_stars = results.to_stars()
     
     if not filtered_stars:
         console.print("[yellow]No stars match your search criteria.[/yellow]")
@@ -243,44 +341,36 @@ def search(mag_limit, min_mag, constellation, spectral_type, sort_by, limit,
     # Create results table
     title = "Star Search Results"
     if visible_now:
-        observer = parse_observer_location(location)
         title += f" (Visible Now from {observer.name})"
     
-    table = Table(title=title)
-    table.add_column("Star", style="cyan")
-    table.add_column("Constellation", style="green")
-    table.add_column("Magnitude", style="yellow", justify="right")
-    table.add_column("Spectral Type", style="blue")
-    table.add_column("Coordinates", style="magenta")
+    table = make_table(title, SEARCH_COLUMNS + SEARCH_POSITION_COLUMNS if visible_now else SEARCH_COLUMNS)
     
-    if visible_now:
-        table.add_column("Altitude", style="red", justify="right")
-        table.add_column("Azimuth", style="red", justify="right")
+    # Format numeric columns in one vectorized pass each
+    magnitude_strs = np.char.mod("%.2f", results.magnitude).tolist()
     
-    for star in filtered_stars:
-        coords = format_coordinates(star.ra_hours, star.dec_degrees)
-        
-        if visible_now:
-            # Calculate current position
-            observer = parse_observer_location(location)
-            horizontal = ra_dec_to_alt_az(star.ra_hours, star.dec_degrees, observer, datetime.now())
-            
+    if visible_now:
+        altitude_strs = np.char.mod("%.1f°", altitudes).tolist()
+        azimuth_strs = np.char.mod("%.1f°", azimuths).tolist()
+        for star, magnitude_str, altitude_str, azimuth_str in zip(
+            filtered_stars, magnitude_strs, altitude_strs, azimuth_strs
+        ):
             table.add_row(
                 star.name,
                 star.constellation,
-                f"{star.magnitude:.2f}",
+                magnitude_str,
                 star.spectral_type,
-                coords,
-                f"{horizontal.altitude:.1f}°",
-                f"{horizontal.azimuth:.1f}°"
+                format_coordinates(star.ra_hours, star.dec_degrees),
+                altitude_str,
+                azimuth_str
             )
-        else:
+    else:
+        for star, magnitude_str in zip(filtered_stars, magnitude_strs):
             table.add_row(
                 star.name,
                 star.constellation,
-                f"{star.magnitude:.2f}",
+                magnitude_str,
                 star.spectral_type,
-                coords
+                format_coordinates(star.ra_hours, star.dec_degrees)
             )
     
     console.print(table)
@@ -297,6 +387,12 @@ def search(mag_limit, min_mag, constellation, spectral_type, sort_by, limit,
 def visible(location, date, time_range, min_altitude, mag_limit, limit):
     """Calculate which stars are visible from your location."""
     
+    import numpy as np
+    from ..calculations.visibility import (
+        calculate_current_visibility, calculate_visibility_for_time_range,
+        filter_visible_objects
+    )
+    
     # Load catalog
     stars = load_star_catalog()
     if not stars:
@@ -306,7 +402,7 @@ def visible(location, date, time_range, min_altitude, mag_limit, limit):
     observer = parse_observer_location(location)
     
     # Filter by magnitude first to reduce computation
-    bright_stars = apply_filters(stars, max_magnitude=mag_limit)
+    bright_stars = load_star_catalog_soa().filter_by_magnitude(mag_limit)
     
     # Parse date
     if date:
@@ -321,11 +417,14 @@ def visible(location, date, time_range, min_altitude, mag_limit, limit):
     # Calculate visibility
     if time_range:
         # Parse time range like "20:00-06:00"
+        match = _TIME_RANGE_RE.fullmatch(time_range)
+        if match is None:
+            console.print("[red]Error: Time range must be in HH:MM-HH:MM format[/red]")
+            return
+        start_hour, start_min, end_hour, end_min = map(int, match.groups())
+        
         try:
-            start_str, end_str = time_range.split('-')
-            start_hour, start_min = map(int, start_str.split(':'))
-            end_hour, end_min = map(int, end_str.split(':'))
-            
+            # replace() still rejects out-of-range values such as 25:00
             start_time = obs_date.replace(hour=start_hour, minute=start_min, second=0)
             
             if end_hour < start_hour:  # Crosses midnight
@@ -334,7 +433,8 @@ def visible(location, date, time_range, min_altitude, mag_limit, limit):
                 end_time = obs_date.replace(hour=end_hour, minute=end_min, second=0)
             
             visibility_info = calculate_visibility_for_time_range(
-                bright_stars, observer, start_time, end_time, min_altitude, time_step_minutes=30
+                bright_stars, observer, start_time, end_time, min_altitude,
+                max_results=limit
             )
             
             title = f"Stars Visible {time_range} from {observer.name}"
@@ -345,7 +445,7 @@ def visible(location, date, time_range, min_altitude, mag_limit, limit):
     else:
         # Current visibility
         visibility_info = calculate_current_visibility(
-            bright_stars, observer, obs_date, min_altitude
+            bright_stars, observer, obs_date, min_altitude, max_results=limit
         )
         title = f"Currently Visible Stars from {observer.name}"
     
@@ -357,23 +457,21 @@ def visible(location, date, time_range, min_altitude, mag_limit, limit):
         return
     
     # Create visibility table
-    table = Table(title=title)
-    table.add_column("Star", style="cyan")
-    table.add_column("Altitude", style="yellow", justify="right")
-    table.add_column("Azimuth", style="blue", justify="right")
-    table.add_column("Rise Time", style="green")
-    table.add_column("Set Time", style="red")
-    table.add_column("Transit", style="magenta")
-    
-    for info in visible_objects:
+    table = make_table(title, VISIBLE_COLUMNS)
+    
+    # Format numeric columns in one vectorized pass each
+    altitude_strs = np.char.mod("%.1f°", np.array([info.altitude for info in visible_objects])).tolist()
+    azimuth_strs = np.char.mod("%.1f°", np.array([info.azimuth for info in visible_objects])).tolist()
+    
+    for info, altitude_str, azimuth_str in zip(visible_objects, altitude_strs, azimuth_strs):
         rise_str = info.rise_time.strftime("%H:%M") if info.rise_time else "Circumpolar"
         set_str = info.set_time.strftime("%H:%M") if info.set_time else "Circumpolar"
         transit_str = info.max_altitude_time.strftime("%H:%M") if info.max_altitude_time else "N/A"
         
         table.add_row(
             info.object_name,
-            f"{info.altitude:.1f}°",
-            f"{info.azimuth:.1f}°",
+            altitude_str,
+            azimuth_str,
             rise_str,
             set_str,
             transit_str
@@ -390,26 +488,53 @@ def visible(location, date, time_range, min_altitude, mag_limit, limit):
 def times(object_name, location, date):
     """Calculate rise, set, and transit times for a specific object."""
     
-    # Load catalog
-    stars = load_star_catalog()
-    if not stars:
+    from ..data.catalog_processor import CatalogStats, iter_star_catalog
+    from ..data.fuzzy_match import closest_matches
+    from ..calculations.coordinates import format_coordinates
+    from ..calculations.visibility import calculate_rise_set_times
+    
+    # Only a handful of rows matter here, so stream the catalog instead of
+    # loading all of it
+    catalog_path = next((path for path in CATALOG_PATHS if path.exists()), None)
+    if catalog_path is None:
+        console.print("[red]Error: No star catalog found![/red]")
+        console.print("Run: [cyan]python create_comprehensive_catalog.py[/cyan] to create the catalog")
         return
     
     # Parse location
     observer = parse_observer_location(location)
     
-    # Find the requested star
-    matching_stars = [star for star in stars if object_name.lower() in star.name.lower()]
+    # Find the requested star, lowercasing each catalog name once and
+    # indexing it for the suggestions below
+    name_lower = object_name.lower()
+    matching_stars = []
+    name_index: Dict[str, str] = {}
+    stats = CatalogStats()
+    for star in iter_star_catalog(str(catalog_path), stats):
+        star_name_lower = star.name.lower()
+        name_index.setdefault(star_name_lower, star.name)
+        if name_lower in star_name_lower:
+            matching_stars.append(star)
+    
+    if not stats.valid_records:
+        # A broken catalog, not an unknown star
+        print_catalog_errors(stats.errors)
+        return
+    
+    if stats.errors:
+        console.print(f"[yellow]⚠️  {len(stats.errors)} records had issues[/yellow]")
     
     if not matching_stars:
         console.print(f"[red]No star found matching '{object_name}'[/red]")
         
-        # Suggest similar names
-        suggestions = [star.name for star in stars if 
-                      any(part.lower() in star.name.lower() for part in object_name.lower().split())]
+        # Suggest similar names, ranked by similarity
+        suggestions = [
+            name_index[match]
+            for match in closest_matches(name_lower, list(name_index), limit=5, cutoff=0.6)
+        ]
         if suggestions:
             console.print("Did you mean one of these?")
-            for suggestion in suggestions[:5]:
+            for suggestion in suggestions:
                 console.print(f"  • {suggestion}")
         return
     
@@ -436,9 +561,7 @@ def times(object_name, location, date):
     rise_set = calculate_rise_set_times(star, observer, obs_date)
     
     # Create detailed information table
-    table = Table(title=f"Timing Information for {star.name}")
-    table.add_column("Property", style="cyan")
-    table.add_column("Value", style="magenta")
+    table = make_table(f"Timing Information for {star.name}", PROPERTY_COLUMNS)
     
     table.add_row("Star Name", star.name)
     table.add_row("Constellation", star.constellation)
@@ -463,6 +586,24 @@ def times(object_name, location, date):
     console.print(table)
 
 
+def _do_convert(ra_hours: float, dec_degrees: float, observer: "ObserverLocation", obs_time: datetime):
+    """Convert one RA/Dec position and build the results table for convert."""
+    from ..calculations.coordinates import ra_dec_to_alt_az, format_coordinates
+    
+    horizontal = ra_dec_to_alt_az(ra_hours, dec_degrees, observer, obs_time)
+    
+    table = make_table("Coordinate Conversion Results", PROPERTY_COLUMNS)
+    
+    table.add_row("Input Coordinates", format_coordinates(ra_hours, dec_degrees))
+    table.add_row("Observer Location", observer.name)
+    table.add_row("Observation Time", obs_time.strftime("%Y-%m-%d %H:%M"))
+    table.add_row("Altitude", f"{horizontal.altitude:.1f}°")
+    table.add_row("Azimuth", f"{horizontal.azimuth:.1f}°")
+    table.add_row("Visible?", "Yes" if horizontal.altitude > 0 else "No")
+    
+    return table
+
+
 @cli.command()
 @click.option("--ra", help="Right Ascension in hours (e.g., 14.5)")
 @click.option("--dec", help="Declination in degrees (e.g., 25.3)")
@@ -478,30 +619,12 @@ def convert(ra, dec, location, time):
     try:
         ra_hours = float(ra)
         dec_degrees = float(dec)
-        
-        # Parse location
         observer = parse_observer_location(location)
         
         # Use current time if not specified
         obs_time = datetime.now() if not time else datetime.strptime(time, "%Y-%m-%d %H:%M")
         
-        # Convert coordinates
-        horizontal = ra_dec_to_alt_az(ra_hours, dec_degrees, observer, obs_time)
-        
-        # Display results
-        table = Table(title="Coordinate Conversion Results")
-        table.add_column("Property", style="cyan")
-        table.add_column("Value", style="magenta")
-        
-        table.add_row("Input Coordinates", format_coordinates(ra_hours, dec_degrees))
-        table.add_row("Observer Location", observer.name)
-        table.add_row("Observation Time", obs_time.strftime("%Y-%m-%d %H:%M"))
-        table.add_row("Altitude", f"{horizontal.altitude:.1f}°")
-        table.add_row("Azimuth", f"{horizontal.azimuth:.1f}°")
-        table.add_row("Visible?", "Yes" if horizontal.altitude > 0 else "No")
-        
-        console.print(table)
-        
+        console.print(_do_convert(ra_hours, dec_degrees, observer, obs_time))
     except ValueError as e:
         console.print(f"[red]Error: {e}[/red]")
 
@@ -513,6 +636,12 @@ def convert(ra, dec, location, time):
 def demo(constellation, location, limit):
     """Demonstrate the toolkit with real star data."""
     
+    import numpy as np
+    from ..calculations.coordinates import (
+        ra_dec_to_alt_az_batch, gmst_from_datetime, local_sidereal_time_from_gmst,
+        is_object_visible_array
+    )
+    
     # Load the full catalog
     stars = load_star_catalog()
     if not stars:
@@ -521,55 +650,57 @@ def demo(constellation, location, limit):
     # Parse location
     observer = parse_observer_location(location)
     
-    # Filter by constellation if specified
+    # Filter by constellation if specified, as column operations
+    catalog = load_star_catalog_soa()
     if constellation:
-        demo_stars = apply_filters(stars, constellation=constellation)
-        demo_stars = sort_by_brightness(demo_stars)[:limit]
+        demo_catalog = catalog.filter_by_constellation(constellation).sort_by_brightness().head(limit)
         title_suffix = f" from {constellation}"
     else:
         # Show brightest stars overall
-        demo_stars = sort_by_brightness(stars)[:limit]
+        demo_catalog = catalog.sort_by_brightness().head(limit)
         title_suffix = " (Brightest Stars)"
     
-    if not demo_stars:
+    if not len(demo_catalog):
         console.print(f"[yellow]No stars found for constellation '{constellation}'[/yellow]")
         return
     
+    # One clock read and one sidereal time for every star
     current_time = datetime.now()
+    lst_hours = local_sidereal_time_from_gmst(gmst_from_datetime(current_time), observer.longitude)
+    
+    # Convert every star in one vectorized pass
+    altitudes, azimuths = ra_dec_to_alt_az_batch(
+        demo_catalog.ra_hours, demo_catalog.dec_degrees, observer, current_time, lst_hours,
+        star_trig=(demo_catalog.ra_rad, demo_catalog.sin_dec, demo_catalog.cos_dec)
+    )
+    visible_mask = is_object_visible_array(altitudes)
     
     # Create results table
-    table = Table(title=f"Star Visibility from {observer.name}{title_suffix}")
-    table.add_column("Star", style="cyan")
-    table.add_column("Constellation", style="green")
-    table.add_column("Magnitude", style="yellow", justify="right")
-    table.add_column("Spectral Type", style="blue")
-    table.add_column("Altitude", style="magenta", justify="right")
-    table.add_column("Azimuth", style="red", justify="right")
-    table.add_column("Visible?", style="white")
-    
-    for star in demo_stars:
-        horizontal = ra_dec_to_alt_az(
-            star.ra_hours, 
-            star.dec_degrees, 
-            observer, 
-            current_time
-        )
-        
-        visible = "✓" if horizontal.altitude > 0 else "✗"
+    table = make_table(f"Star Visibility from {observer.name}{title_suffix}", DEMO_COLUMNS)
+    
+    # Format numeric columns in one vectorized pass each
+    magnitude_strs = np.char.mod("%.2f", demo_catalog.magnitude).tolist()
+    altitude_strs = np.char.mod("%.1f°", altitudes).tolist()
+    azimuth_strs = np.char.mod("%.1f°", azimuths).tolist()
+    
+    for star, magnitude_str, altitude_str, azimuth_str, is_visible in zip(
+        demo_catalog.to_stars(), magnitude_strs, altitude_strs, azimuth_strs, visible_mask
+    ):
+        visible = "✓" if is_visible else "✗"
         
         table.add_row(
             star.name,
             star.constellation,
-            f"{star.magnitude:.2f}",
+            magnitude_str,
             star.spectral_type,
-            f"{horizontal.altitude:.1f}°",
-            f"{horizontal.azimuth:.1f}°",
+            altitude_str,
+            azimuth_str,
             visible
         )
     
     console.print(table)
     console.print(f"\n[dim]Calculated for {current_time.strftime('%Y-%m-%d %H:%M')} from {observer.name}[/dim]")
-    console.print(f"[dim]Showing {len(demo_stars)} stars from catalog of {len(stars)} total[/dim]")
+    console.print(f"[dim]Showing {len(demo_catalog)} stars from catalog of {len(stars)} total[/dim]")
 
 
 if __name__ == "__main__":
@@ -4,11 +4,22 @@ Demonstrates pure functions, immutable data, and error-as-data patterns.
 """
 
 import csv
-from dataclasses import dataclass
-from typing import List, Optional, Tuple, Iterator
+import os
+import zipfile
+from dataclasses import dataclass, field
+from operator import attrgetter
+from typing import Dict, List, Optional, Tuple, Iterator
 from pathlib import Path
 
-from ..data.models import StellarObject
+import numpy as np
+
+from ..data.models import StellarObject, _stellar_object_unchecked
+
+try:
+    from ..calculations._fast import catalog_ranges_batch
+except ImportError:
+    # Numba not installed - range checks use NumPy masks below
+    catalog_ranges_batch = None
 
 
 @dataclass(frozen=True)
@@ -38,7 +49,7 @@ def read_catalog_file(filename: str) -> Iterator[dict]:
     Yields raw dictionary entries without processing.
     """
     try:
-        with open(filename, 'r', encoding='utf-8') as file:
+        with open(filename, 'r', encoding='utf-8', newline='') as file:
             reader = csv.DictReader(file)
             for row in reader:
                 yield row
@@ -48,25 +59,96 @@ def read_catalog_file(filename: str) -> Iterator[dict]:
         yield  # This line never executes but makes it a generator
 
 
+# Columns read from a catalog CSV
+_CATALOG_COLUMNS = ('name', 'ra_hours', 'dec_degrees', 'magnitude', 'spectral_type', 'constellation')
+
+# Value parse_catalog_entry uses for each of _CATALOG_COLUMNS when it is absent
+_CATALOG_DEFAULTS = ('', 0, 0, 0, '', '')
+
+def _read_catalog_rows(filename: str) -> Tuple[List[str], List[List[str]]]:
+    """
+    Read a catalog CSV as (header, rows) of raw strings.
+    Blank lines are skipped, as csv.DictReader does. A missing file raises
+    FileNotFoundError.
+    """
+    with open(filename, 'r', encoding='utf-8', newline='') as file:
+        reader = csv.reader(file)
+        header = next(reader, [])
+        return header, [row for row in reader if row]
+
+
+def _row_as_dict(header: List[str], row: List[str]) -> dict:
+    """The dict csv.DictReader yields for row: missing fields are None, extras go under None."""
+    entry = dict(zip(header, row))
+    if len(row) > len(header):
+        entry[None] = row[len(header):]
+    for column in header[len(row):]:
+        entry[column] = None
+    return entry
+
+
+def _parse_floats(values: list) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Convert a column to float64 in one pass, plus a mask of the entries that
+    parsed. Unparseable entries are NaN and False in the mask.
+    """
+    try:
+        return np.array(list(map(float, values)), dtype=np.float64), np.ones(len(values), dtype=bool)
+    except (ValueError, TypeError):
+        pass
+    
+    # At least one bad value - convert element by element to find it
+    parsed = np.full(len(values), np.nan)
+    ok = np.zeros(len(values), dtype=bool)
+    for i, value in enumerate(values):
+        try:
+            parsed[i] = float(value)
+            ok[i] = True
+        except (ValueError, TypeError):
+            pass
+    return parsed, ok
+
+
 def parse_catalog_entry(row: dict) -> Tuple[bool, Optional[CatalogEntry], str]:
     """
     Pure function to parse a single catalog row.
     Returns (success, entry, error_message).
     """
+    name, ra_hours, dec_degrees, magnitude, spectral_type, constellation = map(
+        row.get, _CATALOG_COLUMNS, _CATALOG_DEFAULTS
+    )
     try:
         entry = CatalogEntry(
-            name=row.get('name', '').strip(),
-            ra_hours=float(row.get('ra_hours', 0)),
-            dec_degrees=float(row.get('dec_degrees', 0)),
-            magnitude=float(row.get('magnitude', 0)),
-            spectral_type=row.get('spectral_type', '').strip(),
-            constellation=row.get('constellation', '').strip()
+            name=name.strip(),
+            ra_hours=float(ra_hours),
+            dec_degrees=float(dec_degrees),
+            magnitude=float(magnitude),
+            spectral_type=spectral_type.strip(),
+            constellation=constellation.strip()
         )
         return True, entry, ""
-    except (ValueError, TypeError) as e:
+    except (ValueError, TypeError, AttributeError) as e:
+        # AttributeError: a short row leaves a text field None
         return False, None, f"Parse error in row {row}: {str(e)}"
 
 
+def _ranges_valid(ra_hours: np.ndarray, dec_degrees: np.ndarray, magnitudes: np.ndarray) -> np.ndarray:
+    """
+    Pure function returning the mask of rows whose RA, Dec and magnitude are
+    inside the validate_catalog_entry limits. NaN entries are out of range.
+    """
+    if catalog_ranges_batch is not None:
+        out_valid = np.empty(ra_hours.shape[0], dtype=np.bool_)
+        catalog_ranges_batch(ra_hours, dec_degrees, magnitudes, out_valid)
+        return out_valid
+    
+    return (
+        (ra_hours >= 0) & (ra_hours <= 24)
+        & (dec_degrees >= -90) & (dec_degrees <= 90)
+        & (magnitudes >= -2) & (magnitudes <= 7)
+    )
+
+
 def validate_catalog_entry(entry: CatalogEntry) -> Tuple[bool, str]:
     """
     Pure function to validate catalog entry.
@@ -105,13 +187,13 @@ def catalog_entry_to_stellar_object(entry: CatalogEntry) -> StellarObject:
     Pure function to convert validated catalog entry to StellarObject.
     No validation needed here - entry is already validated.
     """
-    return StellarObject(
-        name=entry.name,
-        ra_hours=entry.ra_hours,
-        dec_degrees=entry.dec_degrees,
-        magnitude=entry.magnitude,
-        spectral_type=entry.spectral_type,
-        constellation=entry.constellation
+    return _stellar_object_unchecked(
+        entry.name,
+        entry.ra_hours,
+        entry.dec_degrees,
+        entry.magnitude,
+        entry.spectral_type,
+        entry.constellation
     )
 
 
@@ -120,7 +202,10 @@ def process_star_catalog(filename: str) -> ParseResult:
     Main pipeline function - processes entire catalog using functional composition.
     Returns results as data, not exceptions (error-as-data pattern).
     """
-    if not Path(filename).exists():
+    # One open, no separate exists() check that could race with it
+    try:
+        header, rows = _read_catalog_rows(filename)
+    except FileNotFoundError:
         return ParseResult(
             success=False,
             data=None,
@@ -128,42 +213,281 @@ def process_star_catalog(filename: str) -> ParseResult:
             total_records=0,
             valid_records=0
         )
+    total_records = len(rows)
+    
+    # Column-at-a-time pipeline: parse and validate whole columns, then only
+    # rejected rows go back through the per-row functions for their messages.
+    # A missing column reads as the same default parse_catalog_entry uses.
+    positions = {column: i for i, column in enumerate(header)}
+    width = max((positions[c] + 1 for c in _CATALOG_COLUMNS if c in positions), default=0)
+    complete = np.array([len(row) >= width for row in rows], dtype=bool)
+    
+    def column(name, default):
+        if name not in positions:
+            return [default] * total_records
+        i = positions[name]
+        return [row[i] if len(row) > i else default for row in rows]
+    
+    names = [value.strip() for value in column('name', '')]
+    spectral_types = [value.strip() for value in column('spectral_type', '')]
+    constellations = [value.strip() for value in column('constellation', '')]
+    ra_hours, ra_ok = _parse_floats(column('ra_hours', 0))
+    dec_degrees, dec_ok = _parse_floats(column('dec_degrees', 0))
+    magnitudes, mag_ok = _parse_floats(column('magnitude', 0))
+    
+    # Same rules as validate_catalog_entry, one mask per rule
+    valid = complete & ra_ok & dec_ok & mag_ok
+    valid &= _ranges_valid(ra_hours, dec_degrees, magnitudes)
+    valid &= np.array([bool(name) for name in names], dtype=bool)
+    valid &= np.array([bool(constellation) for constellation in constellations], dtype=bool)
     
     stellar_objects = []
     errors = []
-    total_records = 0
-    valid_records = 0
     
-    # Functional pipeline: read -> parse -> validate -> convert
-    for row in read_catalog_file(filename):
-        total_records += 1
+    for i, (is_valid, name, ra, dec, magnitude, spectral_type, constellation) in enumerate(zip(
+        valid.tolist(), names, ra_hours.tolist(), dec_degrees.tolist(), magnitudes.tolist(),
+        spectral_types, constellations
+    )):
+        if is_valid:
+            stellar_objects.append(
+                _stellar_object_unchecked(name, ra, dec, magnitude, spectral_type, constellation)
+            )
+            continue
         
-        # Parse the row
-        parse_success, entry, parse_error = parse_catalog_entry(row)
+        # Rejected or irregular row: the scalar pipeline, on the row as
+        # csv.DictReader would have produced it
+        parse_success, entry, parse_error = parse_catalog_entry(_row_as_dict(header, rows[i]))
         if not parse_success:
-            errors.append(f"Row {total_records}: {parse_error}")
+            errors.append(f"Row {i + 1}: {parse_error}")
             continue
         
-        # Validate the entry
-        valid, validation_error = validate_catalog_entry(entry)
-        if not valid:
-            errors.append(f"Row {total_records} ({entry.name}): {validation_error}")
+        entry_valid, validation_error = validate_catalog_entry(entry)
+        if not entry_valid:
+            errors.append(f"Row {i + 1} ({entry.name}): {validation_error}")
             continue
         
-        # Convert to stellar object
-        stellar_object = catalog_entry_to_stellar_object(entry)
-        stellar_objects.append(stellar_object)
-        valid_records += 1
+        stellar_objects.append(catalog_entry_to_stellar_object(entry))
     
     return ParseResult(
         success=len(stellar_objects) > 0,
         data=stellar_objects if stellar_objects else None,
         errors=errors,
         total_records=total_records,
-        valid_records=valid_records
+        valid_records=len(stellar_objects)
     )
 
 
+@dataclass
+class CatalogStats:
+    """
+    Mutable counters that iter_star_catalog fills in as it streams - the
+    totals and messages process_star_catalog returns in its ParseResult.
+    """
+    total_records: int = 0
+    valid_records: int = 0
+    errors: List[str] = field(default_factory=list)
+
+
+def iter_star_catalog(filename: str, stats: Optional[CatalogStats] = None) -> Iterator[StellarObject]:
+    """
+    Stream the valid stars of a catalog CSV one row at a time.
+    Same parse and validation rules as process_star_catalog, but rows are
+    read with csv.reader by column position and nothing is kept once a row
+    has been yielded - for callers that only look for a few stars, or that
+    filter a catalog too large to hold in memory.
+    If stats is given, record counts and rejected-row messages are added to
+    it as rows are read, so they are complete once the iterator is exhausted.
+    """
+    try:
+        with open(filename, 'r', encoding='utf-8', newline='') as file:
+            reader = csv.reader(file)
+            header = next(reader, None)
+            if header is None:
+                return
+            
+            # Column positions as process_star_catalog finds them (last
+            # duplicate wins); rows shorter than the last one are rejected
+            positions = {column: i for i, column in enumerate(header)}
+            width = max((positions[c] + 1 for c in _CATALOG_COLUMNS if c in positions), default=0)
+            
+            # A missing column reads as the same default parse_catalog_entry
+            # uses: the defaults are appended to each row and indexed from the end
+            missing = [(c, d) for c, d in zip(_CATALOG_COLUMNS, _CATALOG_DEFAULTS) if c not in positions]
+            fill = [str(default) for _, default in missing]
+            for offset, (column, _) in enumerate(missing):
+                positions[column] = offset - len(missing)
+            i_name, i_ra, i_dec, i_mag, i_spectral, i_constellation = map(positions.get, _CATALOG_COLUMNS)
+            
+            row_number = 0
+            for row in reader:
+                if not row:
+                    # Blank line, not a record
+                    continue
+                row_number += 1
+                if stats is not None:
+                    stats.total_records += 1
+                
+                if len(row) < width:
+                    if stats is not None:
+                        parse_error = parse_catalog_entry(_row_as_dict(header, row))[2]
+                        stats.errors.append(f"Row {row_number}: {parse_error}")
+                    continue
+                fields = row + fill if fill else row
+                
+                try:
+                    entry = CatalogEntry(
+                        name=fields[i_name].strip(),
+                        ra_hours=float(fields[i_ra]),
+                        dec_degrees=float(fields[i_dec]),
+                        magnitude=float(fields[i_mag]),
+                        spectral_type=fields[i_spectral].strip(),
+                        constellation=fields[i_constellation].strip()
+                    )
+                except ValueError:
+                    if stats is not None:
+                        # Reparse as process_star_catalog does, for the same message
+                        parse_error = parse_catalog_entry(_row_as_dict(header, row))[2]
+                        stats.errors.append(f"Row {row_number}: {parse_error}")
+                    continue
+                
+                entry_valid, validation_error = validate_catalog_entry(entry)
+                if not entry_valid:
+                    if stats is not None:
+                        stats.errors.append(f"Row {row_number} ({entry.name}): {validation_error}")
+                    continue
+                
+                if stats is not None:
+                    stats.valid_records += 1
+                yield catalog_entry_to_stellar_object(entry)
+    except FileNotFoundError:
+        if stats is not None:
+            stats.errors.append(f"Catalog file not found: {filename}")
+        return
+
+
+# Bumped whenever the layout of the .npz catalog cache changes
+_CATALOG_CACHE_VERSION = 1
+
+
+def catalog_cache_path(filename: str) -> Path:
+    """Location of the pre-parsed binary copy of a catalog CSV."""
+    return Path(filename).with_suffix('.npz')
+
+
+def _catalog_columns(stars: List[StellarObject]) -> Dict[str, np.ndarray]:
+    """Stars as the column arrays stored in the binary cache."""
+    return {
+        'names': np.array([star.name for star in stars], dtype=str),
+        'ra_hours': np.array([star.ra_hours for star in stars], dtype=np.float64),
+        'dec_degrees': np.array([star.dec_degrees for star in stars], dtype=np.float64),
+        'magnitude': np.array([star.magnitude for star in stars], dtype=np.float64),
+        'spectral_type': np.array([star.spectral_type for star in stars], dtype=str),
+        'constellation': np.array([star.constellation for star in stars], dtype=str),
+    }
+
+
+def save_catalog_cache(filename: str, result: ParseResult) -> bool:
+    """
+    Write a successful ParseResult next to its CSV as column arrays, so later
+    processes can skip tokenizing and validating the text.
+    The CSV's mtime is stored in the archive to detect stale copies.
+    Returns False if the cache could not be written (e.g. read-only directory).
+    """
+    if not result.success:
+        return False
+    
+    cache_path = catalog_cache_path(filename)
+    tmp_path = cache_path.with_name(cache_path.stem + '.tmp.npz')
+    try:
+        np.savez(
+            tmp_path,
+            version=np.int64(_CATALOG_CACHE_VERSION),
+            csv_mtime=np.float64(Path(filename).stat().st_mtime),
+            total_records=np.int64(result.total_records),
+            errors=np.array(result.errors, dtype=str),
+            **_catalog_columns(result.data)
+        )
+        # Atomic swap so a concurrent reader never sees a half-written file
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        return False
+    
+    return True
+
+
+def _read_catalog_cache(filename: str) -> Optional[Dict[str, np.ndarray]]:
+    """
+    Arrays of the binary cache of a catalog CSV, keyed as save_catalog_cache
+    wrote them. Returns None when there is no cache, or it is unreadable,
+    outdated or does not carry the CSV's current mtime.
+    """
+    try:
+        csv_mtime = Path(filename).stat().st_mtime
+        with np.load(catalog_cache_path(filename), allow_pickle=False) as cache:
+            if int(cache['version']) != _CATALOG_CACHE_VERSION or float(cache['csv_mtime']) != csv_mtime:
+                return None
+            return {key: cache[key] for key in cache.files}
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+        return None
+
+
+def load_catalog_cache(filename: str) -> Optional[ParseResult]:
+    """
+    Rebuild the ParseResult of process_star_catalog from the binary cache.
+    Returns None when there is no usable cache (see _read_catalog_cache) -
+    the caller then parses the CSV as usual.
+    """
+    cache = _read_catalog_cache(filename)
+    if cache is None:
+        return None
+    
+    # Rows were validated before they were cached
+    stellar_objects = [
+        _stellar_object_unchecked(name, ra, dec, mag, spectral_type, constellation)
+        for name, ra, dec, mag, spectral_type, constellation in zip(
+            cache['names'].tolist(),
+            cache['ra_hours'].tolist(),
+            cache['dec_degrees'].tolist(),
+            cache['magnitude'].tolist(),
+            cache['spectral_type'].tolist(),
+            cache['constellation'].tolist()
+        )
+    ]
+    
+    return ParseResult(
+        success=len(stellar_objects) > 0,
+        data=stellar_objects if stellar_objects else None,
+        errors=cache['errors'].tolist(),
+        total_records=int(cache['total_records']),
+        valid_records=len(stellar_objects)
+    )
+
+
+def load_catalog_soa(filename: str) -> Dict[str, np.ndarray]:
+    """
+    Load the valid stars of a catalog CSV as parallel column arrays
+    (struct-of-arrays). Numeric columns are float64 arrays ready for the
+    vectorized coordinate functions. Text columns are object arrays.
+    
+    Reads the same binary cache as load_catalog_cache when it is current,
+    otherwise parses the CSV with process_star_catalog and caches the result.
+    """
+    columns = _read_catalog_cache(filename)
+    if columns is None:
+        result = process_star_catalog(filename)
+        save_catalog_cache(filename, result)
+        columns = _catalog_columns(result.data or [])
+    
+    return {
+        "name": columns['names'].astype(object),
+        "ra_hours": columns['ra_hours'],
+        "dec_degrees": columns['dec_degrees'],
+        "magnitude": columns['magnitude'],
+        "spectral_type": columns['spectral_type'].astype(object),
+        "constellation": columns['constellation'].astype(object)
+    }
+
+
 def filter_by_magnitude(
     stars: List[StellarObject], 
     max_magnitude: Optional[float] = None,
@@ -198,7 +522,7 @@ def filter_by_constellation(
     constellation_lower = constellation.lower()
     return [
         star for star in stars 
-        if constellation_lower in star.constellation.lower()
+        if constellation_lower in star.constellation_lower
     ]
 
 
@@ -213,8 +537,8 @@ def filter_by_spectral_type(
     if not spectral_types:
         return stars
     
-    # Convert to uppercase for comparison
-    types_upper = [t.upper() for t in spectral_types]
+    # Spectral classes as a set, compared against the first character
+    types_upper = frozenset(t[0].upper() for t in spectral_types if t)
     
     return [
         star for star in stars
@@ -227,17 +551,17 @@ def sort_by_brightness(stars: List[StellarObject]) -> List[StellarObject]:
     Pure function to sort stars by brightness (magnitude).
     Lower magnitude = brighter = appears first.
     """
-    return sorted(stars, key=lambda star: star.magnitude)
+    return sorted(stars, key=attrgetter('magnitude'))
 
 
 def sort_by_name(stars: List[StellarObject]) -> List[StellarObject]:
     """Pure function to sort stars alphabetically by name."""
-    return sorted(stars, key=lambda star: star.name)
+    return sorted(stars, key=attrgetter('name'))
 
 
 def sort_by_constellation(stars: List[StellarObject]) -> List[StellarObject]:
     """Pure function to sort stars by constellation, then by brightness."""
-    return sorted(stars, key=lambda star: (star.constellation, star.magnitude))
+    return sorted(stars, key=attrgetter('constellation', 'magnitude'))
 
 
 # Function composition helpers
@@ -249,14 +573,17 @@ def apply_filters(
     spectral_types: Optional[List[str]] = None
 ) -> List[StellarObject]:
     """
-    Apply multiple filters in sequence using function composition.
-    Each filter is a pure function that takes and returns a list.
+    Pure function applying the magnitude, constellation and spectral type
+    filters in one pass over the stars. Same rules as the individual filter
+    functions; the cheap magnitude comparisons run before the string checks.
     """
-    result = stars
-    
-    # Apply filters in sequence
-    result = filter_by_magnitude(result, max_magnitude, min_magnitude)
-    result = filter_by_constellation(result, constellation)
-    result = filter_by_spectral_type(result, spectral_types)
+    constellation_lower = constellation.lower() if constellation is not None else None
+    types_upper = frozenset(t[0].upper() for t in spectral_types if t) if spectral_types else None
     
-    return result
+    return [
+        star for star in stars
+        if (max_magnitude is None or star.magnitude <= max_magnitude)
+        and (min_magnitude is None or star.magnitude >= min_magnitude)
+        and (constellation_lower is None or constellation_lower in star.constellation_lower)
+        and (types_upper is None or (star.spectral_type and star.spectral_type[0].upper() in types_upper))
+    ]
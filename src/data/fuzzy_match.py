@@ -0,0 +1,29 @@
+"""
+Similarity ranking for "did you mean" suggestions.
+Uses rapidfuzz's C implementation when it is installed and falls back to
+difflib from the standard library otherwise.
+"""
+
+import difflib
+from typing import List, Sequence
+
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:
+    # rapidfuzz not installed - rank with difflib below
+    process = None
+
+
+def closest_matches(query: str, choices: Sequence[str], limit: int = 5, cutoff: float = 0.6) -> List[str]:
+    """
+    Pure function returning up to `limit` choices most similar to query,
+    best first. Choices scoring below cutoff (0-1) are dropped.
+    """
+    if process is not None:
+        return [
+            choice for choice, _score, _index in process.extract(
+                query, choices, scorer=fuzz.WRatio, limit=limit, score_cutoff=cutoff * 100.0
+            )
+        ]
+    
+    return difflib.get_close_matches(query, choices, n=limit, cutoff=cutoff)
@@ -3,11 +3,15 @@ Enhanced location input and management system.
 Functional approach to handling custom observer locations.
 """
 
+from bisect import bisect_left
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain
 from typing import Optional, Dict, List, Tuple
 import re
 
 from ..data.models import ObserverLocation
+from .fuzzy_match import closest_matches
 
 
 @dataclass(frozen=True)
@@ -18,87 +22,113 @@ class LocationParseResult:
     error_message: str
 
 
-# Common city coordinates for quick lookup
-CITY_COORDINATES = {
-    # North America
-    "new york": (40.7128, -74.0060, "New York, NY"),
-    "nyc": (40.7128, -74.0060, "New York, NY"),
-    "los angeles": (34.0522, -118.2437, "Los Angeles, CA"),
-    "la": (34.0522, -118.2437, "Los Angeles, CA"),
-    "chicago": (41.8781, -87.6298, "Chicago, IL"),
-    "denver": (39.7392, -104.9903, "Denver, CO"),
-    "seattle": (47.6062, -122.3321, "Seattle, WA"),
-    "boston": (42.3601, -71.0589, "Boston, MA"),
-    "miami": (25.7617, -80.1918, "Miami, FL"),
-    "san francisco": (37.7749, -122.4194, "San Francisco, CA"),
-    "sf": (37.7749, -122.4194, "San Francisco, CA"),
-    "phoenix": (33.4484, -112.0740, "Phoenix, AZ"),
-    "philadelphia": (39.9526, -75.1652, "Philadelphia, PA"),
-    "houston": (29.7604, -95.3698, "Houston, TX"),
-    "dallas": (32.7767, -96.7970, "Dallas, TX"),
-    "atlanta": (33.7490, -84.3880, "Atlanta, GA"),
-    "toronto": (43.6532, -79.3832, "Toronto, ON"),
-    "vancouver": (49.2827, -123.1207, "Vancouver, BC"),
-    "montreal": (45.5017, -73.5673, "Montreal, QC"),
-    "mexico city": (19.4326, -99.1332, "Mexico City, Mexico"),
-    
-    # Europe
-    "london": (51.5074, -0.1278, "London, UK"),
-    "paris": (48.8566, 2.3522, "Paris, France"),
-    "berlin": (52.5200, 13.4050, "Berlin, Germany"),
-    "rome": (41.9028, 12.4964, "Rome, Italy"),
-    "madrid": (40.4168, -3.7038, "Madrid, Spain"),
-    "amsterdam": (52.3676, 4.9041, "Amsterdam, Netherlands"),
-    "vienna": (48.2082, 16.3738, "Vienna, Austria"),
-    "prague": (50.0755, 14.4378, "Prague, Czech Republic"),
-    "stockholm": (59.3293, 18.0686, "Stockholm, Sweden"),
-    "oslo": (59.9139, 10.7522, "Oslo, Norway"),
-    "copenhagen": (55.6761, 12.5683, "Copenhagen, Denmark"),
-    "helsinki": (60.1699, 24.9384, "Helsinki, Finland"),
-    "athens": (37.9838, 23.7275, "Athens, Greece"),
-    "lisbon": (38.7223, -9.1393, "Lisbon, Portugal"),
-    "zurich": (47.3769, 8.5417, "Zurich, Switzerland"),
-    "moscow": (55.7558, 37.6176, "Moscow, Russia"),
-    
-    # Asia
-    "tokyo": (35.6762, 139.6503, "Tokyo, Japan"),
-    "beijing": (39.9042, 116.4074, "Beijing, China"),
-    "shanghai": (31.2304, 121.4737, "Shanghai, China"),
-    "hong kong": (22.3193, 114.1694, "Hong Kong"),
-    "singapore": (1.3521, 103.8198, "Singapore"),
-    "mumbai": (19.0760, 72.8777, "Mumbai, India"),
-    "delhi": (28.7041, 77.1025, "Delhi, India"),
-    "bangalore": (12.9716, 77.5946, "Bangalore, India"),
-    "seoul": (37.5665, 126.9780, "Seoul, South Korea"),
-    "bangkok": (13.7563, 100.5018, "Bangkok, Thailand"),
-    "jakarta": (-6.2088, 106.8456, "Jakarta, Indonesia"),
-    "manila": (14.5995, 120.9842, "Manila, Philippines"),
-    "kuala lumpur": (3.1390, 101.6869, "Kuala Lumpur, Malaysia"),
-    
-    # Australia & Oceania
-    "sydney": (-33.8688, 151.2093, "Sydney, Australia"),
-    "melbourne": (-37.8136, 144.9631, "Melbourne, Australia"),
-    "brisbane": (-27.4698, 153.0251, "Brisbane, Australia"),
-    "perth": (-31.9505, 115.8605, "Perth, Australia"),
-    "auckland": (-36.8485, 174.7633, "Auckland, New Zealand"),
-    "wellington": (-41.2865, 174.7762, "Wellington, New Zealand"),
-    
-    # South America
-    "buenos aires": (-34.6118, -58.3960, "Buenos Aires, Argentina"),
-    "sao paulo": (-23.5558, -46.6396, "São Paulo, Brazil"),
-    "rio de janeiro": (-22.9068, -43.1729, "Rio de Janeiro, Brazil"),
-    "santiago": (-33.4489, -70.6693, "Santiago, Chile"),
-    "lima": (-12.0464, -77.0428, "Lima, Peru"),
-    "bogota": (4.7110, -74.0721, "Bogotá, Colombia"),
-    
-    # Africa
-    "cairo": (30.0444, 31.2357, "Cairo, Egypt"),
-    "cape town": (-33.9249, 18.4241, "Cape Town, South Africa"),
-    "johannesburg": (-26.2041, 28.0473, "Johannesburg, South Africa"),
-    "nairobi": (-1.2921, 36.8219, "Nairobi, Kenya"),
-    "lagos": (6.5244, 3.3792, "Lagos, Nigeria"),
-    "casablanca": (33.5731, -7.5898, "Casablanca, Morocco"),
-}
+# Short names resolving to the same entry as the full city name
+_CITY_ALIASES = {"nyc": "new york", "la": "los angeles", "sf": "san francisco"}
+
+
+@lru_cache(maxsize=None)
+def _city_coordinates() -> Dict[str, Tuple[float, float, str]]:
+    """
+    Common city coordinates for quick lookup, built on first use rather than
+    at import. Aliases share their city's (lat, lon, display name) tuple.
+    """
+    cities = {
+        # North America
+        "new york": (40.7128, -74.0060, "New York, NY"),
+        "los angeles": (34.0522, -118.2437, "Los Angeles, CA"),
+        "chicago": (41.8781, -87.6298, "Chicago, IL"),
+        "denver": (39.7392, -104.9903, "Denver, CO"),
+        "seattle": (47.6062, -122.3321, "Seattle, WA"),
+        "boston": (42.3601, -71.0589, "Boston, MA"),
+        "miami": (25.7617, -80.1918, "Miami, FL"),
+        "san francisco": (37.7749, -122.4194, "San Francisco, CA"),
+        "phoenix": (33.4484, -112.0740, "Phoenix, AZ"),
+        "philadelphia": (39.9526, -75.1652, "Philadelphia, PA"),
+        "houston": (29.7604, -95.3698, "Houston, TX"),
+        "dallas": (32.7767, -96.7970, "Dallas, TX"),
+        "atlanta": (33.7490, -84.3880, "Atlanta, GA"),
+        "toronto": (43.6532, -79.3832, "Toronto, ON"),
+        "vancouver": (49.2827, -123.1207, "Vancouver, BC"),
+        "montreal": (45.5017, -73.5673, "Montreal, QC"),
+        "mexico city": (19.4326, -99.1332, "Mexico City, Mexico"),
+        
+        # Europe
+        "london": (51.5074, -0.1278, "London, UK"),
+        "paris": (48.8566, 2.3522, "Paris, France"),
+        "berlin": (52.5200, 13.4050, "Berlin, Germany"),
+        "rome": (41.9028, 12.4964, "Rome, Italy"),
+        "madrid": (40.4168, -3.7038, "Madrid, Spain"),
+        "amsterdam": (52.3676, 4.9041, "Amsterdam, Netherlands"),
+        "vienna": (48.2082, 16.3738, "Vienna, Austria"),
+        "prague": (50.0755, 14.4378, "Prague, Czech Republic"),
+        "stockholm": (59.3293, 18.0686, "Stockholm, Sweden"),
+        "oslo": (59.9139, 10.7522, "Oslo, Norway"),
+        "copenhagen": (55.6761, 12.5683, "Copenhagen, Denmark"),
+        "helsinki": (60.1699, 24.9384, "Helsinki, Finland"),
+        "athens": (37.9838, 23.7275, "Athens, Greece"),
+        "lisbon": (38.7223, -9.1393, "Lisbon, Portugal"),
+        "zurich": (47.3769, 8.5417, "Zurich, Switzerland"),
+        "moscow": (55.7558, 37.6176, "Moscow, Russia"),
+        
+        # Asia
+        "tokyo": (35.6762, 139.6503, "Tokyo, Japan"),
+        "beijing": (39.9042, 116.4074, "Beijing, China"),
+        "shanghai": (31.2304, 121.4737, "Shanghai, China"),
+        "hong kong": (22.3193, 114.1694, "Hong Kong"),
+        "singapore": (1.3521, 103.8198, "Singapore"),
+        "mumbai": (19.0760, 72.8777, "Mumbai, India"),
+        "delhi": (28.7041, 77.1025, "Delhi, India"),
+        "bangalore": (12.9716, 77.5946, "Bangalore, India"),
+        "seoul": (37.5665, 126.9780, "Seoul, South Korea"),
+        "bangkok": (13.7563, 100.5018, "Bangkok, Thailand"),
+        "jakarta": (-6.2088, 106.8456, "Jakarta, Indonesia"),
+        "manila": (14.5995, 120.9842, "Manila, Philippines"),
+        "kuala lumpur": (3.1390, 101.6869, "Kuala Lumpur, Malaysia"),
+        
+        # Australia & Oceania
+        "sydney": (-33.8688, 151.2093, "Sydney, Australia"),
+        "melbourne": (-37.8136, 144.9631, "Melbourne, Australia"),
+        "brisbane": (-27.4698, 153.0251, "Brisbane, Australia"),
+        "perth": (-31.9505, 115.8605, "Perth, Australia"),
+        "auckland": (-36.8485, 174.7633, "Auckland, New Zealand"),
+        "wellington": (-41.2865, 174.7762, "Wellington, New Zealand"),
+        
+        # South America
+        "buenos aires": (-34.6118, -58.3960, "Buenos Aires, Argentina"),
+        "sao paulo": (-23.5558, -46.6396, "São Paulo, Brazil"),
+        "rio de janeiro": (-22.9068, -43.1729, "Rio de Janeiro, Brazil"),
+        "santiago": (-33.4489, -70.6693, "Santiago, Chile"),
+        "lima": (-12.0464, -77.0428, "Lima, Peru"),
+        "bogota": (4.7110, -74.0721, "Bogotá, Colombia"),
+        
+        # Africa
+        "cairo": (30.0444, 31.2357, "Cairo, Egypt"),
+        "cape town": (-33.9249, 18.4241, "Cape Town, South Africa"),
+        "johannesburg": (-26.2041, 28.0473, "Johannesburg, South Africa"),
+        "nairobi": (-1.2921, 36.8219, "Nairobi, Kenya"),
+        "lagos": (6.5244, 3.3792, "Lagos, Nigeria"),
+        "casablanca": (33.5731, -7.5898, "Casablanca, Morocco"),
+    }
+    for alias, city in _CITY_ALIASES.items():
+        cities[alias] = cities[city]
+    return cities
+
+
+def __getattr__(name: str):
+    """Module attributes built lazily (PEP 562): CITY_COORDINATES."""
+    if name == "CITY_COORDINATES":
+        return _city_coordinates()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Degrees, then either integer minutes and seconds (DMS) or decimal
+# minutes (DM), then an optional direction. The DMS branch is tried first;
+# groups: degrees, DMS minutes, DMS seconds, DM minutes, direction
+_DMS_RE = re.compile(
+    r"(\d+)[°D]\s*"
+    r"(?:(\d+)[\'M]\s*(\d+(?:\.\d+)?)[\"S]?|(\d+(?:\.\d+)?)[\'M]?)"
+    r"\s*([NSEW]?)"
+)
 
 
 def parse_coordinate_string(coord_str: str) -> Tuple[bool, float, str]:
@@ -115,47 +145,34 @@ def parse_coordinate_string(coord_str: str) -> Tuple[bool, float, str]:
     """
     coord_str = coord_str.strip().upper()
     
-    # Try decimal degrees first
-    try:
-        value = float(coord_str)
-        return True, value, ""
-    except ValueError:
-        pass
-    
-    # Try DMS format: 40°42'46"N or 40d42m46sN
-    dms_pattern = r"(\d+)[°D]\s*(\d+)[\'M]\s*(\d+(?:\.\d+)?)[\"S]?\s*([NSEW]?)"
-    match = re.match(dms_pattern, coord_str)
-    
-    if match:
-        degrees = int(match.group(1))
-        minutes = int(match.group(2))
-        seconds = float(match.group(3))
-        direction = match.group(4)
-        
-        # Convert to decimal degrees
-        decimal = degrees + minutes/60.0 + seconds/3600.0
-        
-        # Apply direction
-        if direction in ['S', 'W']:
-            decimal = -decimal
-        
-        return True, decimal, ""
-    
-    # Try simple degrees and minutes: 40°42'N
-    dm_pattern = r"(\d+)[°D]\s*(\d+(?:\.\d+)?)[\'M]?\s*([NSEW]?)"
-    match = re.match(dm_pattern, coord_str)
-    
-    if match:
-        degrees = int(match.group(1))
-        minutes = float(match.group(2))
-        direction = match.group(3)
-        
-        decimal = degrees + minutes/60.0
-        
-        if direction in ['S', 'W']:
-            decimal = -decimal
+    # float() rejects any string with a degree marker and the DMS pattern
+    # requires one, so the marker picks the single parser to try - DMS input
+    # no longer pays for a failed float() first
+    if '°' not in coord_str and 'D' not in coord_str:
+        # Decimal degrees
+        try:
+            value = float(coord_str)
+            return True, value, ""
+        except ValueError:
+            pass
+    else:
+        # DMS (40°42'46"N, 40d42m46sN) or degrees and minutes (40°42'N)
+        match = _DMS_RE.match(coord_str)
         
-        return True, decimal, ""
+        if match:
+            degrees, minutes, seconds, dm_minutes, direction = match.groups()
+            
+            # Convert to decimal degrees
+            if seconds is not None:
+                decimal = int(degrees) + int(minutes)/60.0 + float(seconds)/3600.0
+            else:
+                decimal = int(degrees) + float(dm_minutes)/60.0
+            
+            # Apply direction
+            if direction in ['S', 'W']:
+                decimal = -decimal
+            
+            return True, decimal, ""
     
     return False, 0.0, f"Could not parse coordinate: {coord_str}"
 
@@ -182,9 +199,9 @@ def parse_location_input(location_str: str) -> LocationParseResult:
         )
     
     # Check if it's a known city
-    city_key = location_str.lower()
-    if city_key in CITY_COORDINATES:
-        lat, lon, name = CITY_COORDINATES[city_key]
+    city = _city_coordinates().get(location_str.lower())
+    if city is not None:
+        lat, lon, name = city
         return LocationParseResult(
             success=True,
             location=ObserverLocation(lat, lon, name),
@@ -249,27 +266,72 @@ def parse_location_input(location_str: str) -> LocationParseResult:
     )
 
 
+@lru_cache(maxsize=None)
+def _sorted_city_keys() -> Tuple[str, ...]:
+    """City keys in sorted order; keys sharing a prefix form one contiguous run."""
+    return tuple(sorted(_city_coordinates()))
+
+
+def _city_keys_with_prefix(prefix: str) -> Tuple[str, ...]:
+    """Pure function returning the city keys starting with prefix, via bisection."""
+    if not prefix:
+        return ()
+    keys = _sorted_city_keys()
+    start = bisect_left(keys, prefix)
+    end = bisect_left(keys, prefix + "\U0010ffff", start)
+    return keys[start:end]
+
+
+@lru_cache(maxsize=None)
+def _city_word_index() -> Dict[str, Tuple[str, ...]]:
+    """Each word of the city keys mapped to the keys containing it ("york" -> ("new york",))."""
+    index: Dict[str, List[str]] = {}
+    for city_key in _city_coordinates():
+        for word in city_key.split():
+            index.setdefault(word, []).append(city_key)
+    return {word: tuple(keys) for word, keys in index.items()}
+
+
 def suggest_similar_cities(input_str: str, max_suggestions: int = 5) -> List[str]:
     """
     Find city names similar to the input string.
     Pure function for providing helpful suggestions.
     """
-    input_lower = input_str.lower()
-    suggestions = []
+    input_lower = input_str.lower().strip()
+    input_words = input_lower.split()
+    cities = _city_coordinates()
+    word_index = _city_word_index()
+    
+    # Display names in the order found; a dict doubles as an ordered set
+    seen: Dict[str, None] = {}
     
-    for city_key, (lat, lon, display_name) in CITY_COORDINATES.items():
-        # Check if input is a substring of the city name
-        if input_lower in city_key or any(word in city_key for word in input_lower.split()):
-            suggestions.append(display_name)
+    # City names starting with the input or with any word of it, then the
+    # cities that have one of the input's words as a word of their own, then
+    # any city containing the input or one of its words ("ork" -> New York).
+    # Lazy, so the full scan only runs when the indexed lookups fall short.
+    candidate_keys = chain(
+        chain.from_iterable(_city_keys_with_prefix(prefix) for prefix in [input_lower] + input_words),
+        chain.from_iterable(word_index.get(word, ()) for word in input_words),
+        (
+            city_key for city_key in cities
+            if input_lower and (input_lower in city_key or any(word in city_key for word in input_words))
+        ),
+    )
+    for city_key in candidate_keys:
+        seen.setdefault(cities[city_key][2], None)
+        if len(seen) >= max_suggestions:
+            break
+    else:
+        # Then the closest spellings, which catch typos like "Londn"
+        for city_key in closest_matches(input_lower, list(cities), limit=max_suggestions):
+            seen.setdefault(cities[city_key][2], None)
     
-    # Remove duplicates and limit
-    unique_suggestions = list(dict.fromkeys(suggestions))
-    return unique_suggestions[:max_suggestions]
+    return list(seen)[:max_suggestions]
 
 
 def get_all_supported_cities() -> List[str]:
     """Get list of all supported city names for help display."""
-    cities = [display_name for _, _, display_name in CITY_COORDINATES.values()]
+    cities = [display_name for _, _, display_name in _city_coordinates().values()]
     return sorted(list(set(cities)))
 
 
@@ -320,6 +382,18 @@ def validate_location_for_astronomy(location: ObserverLocation) -> Tuple[bool, s
     return True, ""
 
 
+# Upper |latitude| bound of each band (inclusive) and the label of each band;
+# one more label than edges, for the band beyond the last edge
+_CLIMATE_EDGES = (23.5, 35.0, 50.0, 66.5)
+_CLIMATE_LABELS = ("Tropical", "Subtropical", "Temperate", "Subarctic/Subantarctic", "Arctic/Antarctic")
+_VISIBILITY_EDGES = (35.0, 55.0)
+_VISIBILITY_LABELS = (
+    "Can see both northern and southern sky objects",
+    "Good view of circumpolar stars, limited southern sky",
+    "Many circumpolar stars, very limited southern sky",
+)
+
+
 def get_location_info(location: ObserverLocation) -> Dict[str, str]:
     """
     Get descriptive information about a location.
@@ -329,26 +403,10 @@ def get_location_info(location: ObserverLocation) -> Dict[str, str]:
     lat_hemisphere = "Northern" if location.latitude >= 0 else "Southern"
     lon_hemisphere = "Eastern" if location.longitude >= 0 else "Western"
     
-    # Determine climate zone (rough approximation)
+    # Climate zone (rough approximation) and visibility from latitude bands
     abs_lat = abs(location.latitude)
-    if abs_lat <= 23.5:
-        climate_zone = "Tropical"
-    elif abs_lat <= 35:
-        climate_zone = "Subtropical"
-    elif abs_lat <= 50:
-        climate_zone = "Temperate"
-    elif abs_lat <= 66.5:
-        climate_zone = "Subarctic/Subantarctic"
-    else:
-        climate_zone = "Arctic/Antarctic"
-    
-    # Determine visibility characteristics
-    if abs_lat <= 35:
-        visibility_note = "Can see both northern and southern sky objects"
-    elif abs_lat <= 55:
-        visibility_note = "Good view of circumpolar stars, limited southern sky"
-    else:
-        visibility_note = "Many circumpolar stars, very limited southern sky"
+    climate_zone = _CLIMATE_LABELS[bisect_left(_CLIMATE_EDGES, abs_lat)]
+    visibility_note = _VISIBILITY_LABELS[bisect_left(_VISIBILITY_EDGES, abs_lat)]
     
     return {
         "hemisphere": f"{lat_hemisphere} Hemisphere, {lon_hemisphere} Longitude",
@@ -359,6 +417,11 @@ def get_location_info(location: ObserverLocation) -> Dict[str, str]:
     }
 
 
+# Hundredths of an arcsecond, the resolution format_coordinate_dms prints
+_CENTIARCSEC_PER_ARCMIN = 60 * 100
+_CENTIARCSEC_PER_DEGREE = 60 * _CENTIARCSEC_PER_ARCMIN
+
+
 def format_coordinate_dms(coord: float, is_latitude: bool) -> str:
     """
     Format coordinate in degrees, minutes, seconds.
@@ -370,10 +433,12 @@ def format_coordinate_dms(coord: float, is_latitude: bool) -> str:
     else:
         direction = "E" if coord >= 0 else "W"
     
-    abs_coord = abs(coord)
-    degrees = int(abs_coord)
-    minutes_float = (abs_coord - degrees) * 60
-    minutes = int(minutes_float)
-    seconds = (minutes_float - minutes) * 60
+    # Round once to the displayed hundredths of an arcsecond, then split with
+    # integer divmod - exact, and 59.999" carries into the minutes instead of
+    # printing as 60.00"
+    centiseconds = round(abs(coord) * _CENTIARCSEC_PER_DEGREE)
+    degrees, centiseconds = divmod(centiseconds, _CENTIARCSEC_PER_DEGREE)
+    minutes, centiseconds = divmod(centiseconds, _CENTIARCSEC_PER_ARCMIN)
+    seconds, hundredths = divmod(centiseconds, 100)
     
-    return f"{degrees}°{minutes:02d}'{seconds:05.2f}\"{direction}"
+    return f"{degrees}°{minutes:02d}'{seconds:02d}.{hundredths:02d}\"{direction}"
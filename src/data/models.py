@@ -3,20 +3,29 @@ Core data models for astronomical objects and calculations.
 Built with functional programming principles - immutable data structures.
 """
 
-from dataclasses import dataclass
-from typing import Optional, List
+import math
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Dict, Optional, List, Sequence, Tuple
 from datetime import datetime
 
+import numpy as np
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class StellarObject:
-    """Immutable representation of a stellar object."""
+    """
+    Immutable representation of a stellar object.
+    Slotted - no per-instance __dict__, since catalogs hold many of these.
+    """
     name: str
     ra_hours: float  # Right Ascension in hours (0-24)
     dec_degrees: float  # Declination in degrees (-90 to +90)
     magnitude: float  # Visual magnitude (lower = brighter)
     spectral_type: str  # Stellar classification (O, B, A, F, G, K, M)
     constellation: str  # Constellation name
+    # Lowercase constellation, so case-insensitive filters don't redo it per call
+    constellation_lower: str = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate data ranges."""
@@ -24,25 +33,229 @@ class StellarObject:
             raise ValueError(f"RA must be 0-24 hours, got {self.ra_hours}")
         if not (-90 <= self.dec_degrees <= 90):
             raise ValueError(f"Dec must be -90 to +90 degrees, got {self.dec_degrees}")
+        object.__setattr__(self, 'constellation_lower', self.constellation.lower())
+
+
+def _stellar_object_unchecked(
+    name: str, ra_hours: float, dec_degrees: float, magnitude: float,
+    spectral_type: str, constellation: str
+) -> StellarObject:
+    """
+    Build a StellarObject without running __post_init__'s range checks, for
+    catalog rows that validate_catalog_entry has already accepted.
+    """
+    star = object.__new__(StellarObject)
+    object.__setattr__(star, 'name', name)
+    object.__setattr__(star, 'ra_hours', ra_hours)
+    object.__setattr__(star, 'dec_degrees', dec_degrees)
+    object.__setattr__(star, 'magnitude', magnitude)
+    object.__setattr__(star, 'spectral_type', spectral_type)
+    object.__setattr__(star, 'constellation', constellation)
+    object.__setattr__(star, 'constellation_lower', constellation.lower())
+    return star
+
+
+def _top_k_candidates(keys: np.ndarray, limit: Optional[int]) -> np.ndarray:
+    """
+    Positions whose key is at most the limit-th smallest key, in input order:
+    the first limit rows of any stable sort on keys are among them. One
+    O(N) partition, so only these candidates need a full sort. Every
+    position when there is no positive limit below the length.
+    """
+    if limit is None or not 0 < limit < len(keys):
+        return np.arange(len(keys))
+    kth = np.partition(keys, limit - 1)[limit - 1]
+    # Ties with the limit-th key are kept, so stability is not lost
+    return np.flatnonzero(keys <= kth)
+
+
+@dataclass(frozen=True, eq=False)
+class StellarCatalog:
+    """
+    Immutable struct-of-arrays view of a list of stellar objects.
+    Batched calculations read contiguous coordinate arrays instead of
+    pulling attributes off every StellarObject, and filters and sorts are
+    single vectorized passes that return sub-catalogs.
+    """
+    names: List[str]
+    ra_hours: np.ndarray  # float64, shape (N,)
+    dec_degrees: np.ndarray  # float64, shape (N,)
+    magnitude: np.ndarray  # float64, shape (N,)
+    spectral_types: np.ndarray  # str, shape (N,)
+    constellations: np.ndarray  # str, shape (N,)
+    # Time-invariant trig terms, shared by every conversion of this catalog
+    ra_rad: np.ndarray = field(init=False, repr=False)
+    sin_dec: np.ndarray = field(init=False, repr=False)
+    cos_dec: np.ndarray = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        """Precompute the per-star trig terms once."""
+        dec_rad = np.deg2rad(self.dec_degrees)
+        object.__setattr__(self, 'ra_rad', np.deg2rad(self.ra_hours * 15.0))
+        object.__setattr__(self, 'sin_dec', np.sin(dec_rad))
+        object.__setattr__(self, 'cos_dec', np.cos(dec_rad))
+    
+    # Dictionary-encoded text columns: each distinct value once, plus a small
+    # integer code per star indexing into it. Built on first use, since the
+    # coordinate-only callers never filter by text.
+    
+    @cached_property
+    def constellation_encoding(self) -> Tuple[np.ndarray, np.ndarray]:
+        """(distinct lowercase constellations, code per star)."""
+        categories, codes = np.unique(np.char.lower(self.constellations), return_inverse=True)
+        return categories, codes.astype(np.min_scalar_type(len(categories)))
+    
+    @cached_property
+    def spectral_encoding(self) -> Tuple[np.ndarray, np.ndarray]:
+        """(distinct uppercase first letters of the spectral type, code per star)."""
+        classes, codes = np.unique(np.char.upper(self.spectral_types.astype('U1')), return_inverse=True)
+        return classes, codes.astype(np.min_scalar_type(len(classes)))
+    
+    @classmethod
+    def from_stars(cls, stars: Sequence[StellarObject]) -> "StellarCatalog":
+        """Build the arrays in one pass each; index i matches stars[i]."""
+        count = len(stars)
+        columns = (
+            np.fromiter((star.ra_hours for star in stars), dtype=np.float64, count=count),
+            np.fromiter((star.dec_degrees for star in stars), dtype=np.float64, count=count),
+            np.fromiter((star.magnitude for star in stars), dtype=np.float64, count=count),
+            np.array([star.spectral_type for star in stars], dtype=str),
+            np.array([star.constellation for star in stars], dtype=str),
+        )
+        for column in columns:
+            column.flags.writeable = False
+        return cls([star.name for star in stars], *columns)
+    
+    @classmethod
+    def from_columns(cls, columns: Dict[str, np.ndarray]) -> "StellarCatalog":
+        """
+        Build from the column arrays of load_catalog_soa. Numeric columns keep
+        their dtype; text columns become fixed-width str arrays.
+        """
+        arrays = (
+            np.asarray(columns['ra_hours']),
+            np.asarray(columns['dec_degrees']),
+            np.asarray(columns['magnitude']),
+            np.asarray(columns['spectral_type'], dtype=str),
+            np.asarray(columns['constellation'], dtype=str),
+        )
+        for array in arrays:
+            array.flags.writeable = False
+        return cls([str(name) for name in columns['name']], *arrays)
+    
+    def __len__(self) -> int:
+        return len(self.names)
+    
+    def __getitem__(self, index: int) -> StellarObject:
+        """Row index as a StellarObject, for code that works per star."""
+        return StellarObject(
+            self.names[index],
+            float(self.ra_hours[index]),
+            float(self.dec_degrees[index]),
+            float(self.magnitude[index]),
+            str(self.spectral_types[index]),
+            str(self.constellations[index])
+        )
+    
+    def to_stars(self) -> List[StellarObject]:
+        """Every row as a StellarObject, in catalog order."""
+        return [self[i] for i in range(len(self))]
+    
+    def take(self, indices: np.ndarray) -> "StellarCatalog":
+        """Sub-catalog of the given positions, in the given order."""
+        names = self.names
+        return StellarCatalog(
+            [names[i] for i in indices],
+            self.ra_hours[indices],
+            self.dec_degrees[indices],
+            self.magnitude[indices],
+            self.spectral_types[indices],
+            self.constellations[indices]
+        )
+    
+    def head(self, count: int) -> "StellarCatalog":
+        """The first count rows, with list slicing semantics."""
+        return self.take(np.arange(len(self))[:count])
+    
+    def filter_by_magnitude(
+        self,
+        max_magnitude: Optional[float] = None,
+        min_magnitude: Optional[float] = None
+    ) -> "StellarCatalog":
+        """Stars within the magnitude limits (lower magnitude = brighter)."""
+        mask = np.ones(len(self), dtype=bool)
+        if max_magnitude is not None:
+            mask &= self.magnitude <= max_magnitude
+        if min_magnitude is not None:
+            mask &= self.magnitude >= min_magnitude
+        return self.take(np.flatnonzero(mask))
+    
+    def filter_by_constellation(self, constellation: Optional[str] = None) -> "StellarCatalog":
+        """Stars whose constellation contains the given text, ignoring case."""
+        if constellation is None:
+            return self
+        # Match against the distinct names, then select stars by code
+        categories, codes = self.constellation_encoding
+        matching = np.flatnonzero(np.char.find(categories, constellation.lower()) >= 0)
+        return self.take(np.flatnonzero(np.isin(codes, matching)))
+    
+    def filter_by_spectral_type(self, spectral_types: Optional[List[str]] = None) -> "StellarCatalog":
+        """Stars whose spectral type starts with one of the given classes (O, B, A, ...)."""
+        if not spectral_types:
+            return self
+        # Stars without a spectral type never match
+        classes, codes = self.spectral_encoding
+        matching = np.flatnonzero(np.isin(classes, [t[0].upper() for t in spectral_types if t]) & (classes != ''))
+        return self.take(np.flatnonzero(np.isin(codes, matching)))
+    
+    def sort_by_brightness(self, limit: Optional[int] = None) -> "StellarCatalog":
+        """
+        Brightest first; stable, so equal magnitudes keep catalog order.
+        With a limit, only the first limit rows are returned and only the
+        rows that can be among them are sorted.
+        """
+        candidates = _top_k_candidates(self.magnitude, limit)
+        order = candidates[np.argsort(self.magnitude[candidates], kind='stable')]
+        return self.take(order[:limit])
+    
+    def sort_by_name(self, limit: Optional[int] = None) -> "StellarCatalog":
+        """Alphabetical by name; stable. limit as for sort_by_brightness."""
+        names = np.array(self.names, dtype=str)
+        candidates = _top_k_candidates(names, limit)
+        order = candidates[np.argsort(names[candidates], kind='stable')]
+        return self.take(order[:limit])
+    
+    def sort_by_constellation(self, limit: Optional[int] = None) -> "StellarCatalog":
+        """By constellation, then brightness; stable. limit as for sort_by_brightness."""
+        candidates = _top_k_candidates(self.constellations, limit)
+        order = candidates[np.lexsort((self.magnitude[candidates], self.constellations[candidates]))]
+        return self.take(order[:limit])
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ObserverLocation:
     """Immutable representation of an observer's location."""
     latitude: float  # Degrees North (-90 to +90)
     longitude: float  # Degrees East (-180 to +180)
     name: str  # Human-readable location name
     timezone_offset: float = 0.0  # Hours from UTC
+    # Latitude trig terms, constant for every conversion from this location
+    sin_lat_rad: float = field(init=False, repr=False, compare=False)
+    cos_lat_rad: float = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
-        """Validate coordinates."""
+        """Validate coordinates and precompute latitude trig terms."""
         if not (-90 <= self.latitude <= 90):
             raise ValueError(f"Latitude must be -90 to +90, got {self.latitude}")
         if not (-180 <= self.longitude <= 180):
             raise ValueError(f"Longitude must be -180 to +180, got {self.longitude}")
+        
+        lat_rad = math.radians(self.latitude)
+        object.__setattr__(self, 'sin_lat_rad', math.sin(lat_rad))
+        object.__setattr__(self, 'cos_lat_rad', math.cos(lat_rad))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HorizontalCoordinates:
     """Immutable representation of horizontal (Alt/Az) coordinates."""
     altitude: float  # Degrees above horizon (0-90)
@@ -56,7 +269,7 @@ class HorizontalCoordinates:
             raise ValueError(f"Azimuth must be 0-360 degrees, got {self.azimuth}")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VisibilityInfo:
     """Immutable representation of object visibility data."""
     object_name: str
@@ -68,7 +281,7 @@ class VisibilityInfo:
     max_altitude_time: Optional[datetime] = None
     
     
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SearchCriteria:
     """Immutable search criteria for filtering stellar objects."""
     max_magnitude: Optional[float] = None
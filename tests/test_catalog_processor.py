@@ -0,0 +1,132 @@
+"""
+Regression tests for the catalog loaders.
+Run with: python -m unittest discover tests
+"""
+
+import os
+import tempfile
+import unittest
+
+from src.data.catalog_processor import CatalogStats, iter_star_catalog, process_star_catalog
+
+
+HEADER = "name,ra_hours,dec_degrees,magnitude,spectral_type,constellation"
+
+
+class ProcessStarCatalogTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+    
+    def load(self, text, newline="\n"):
+        """process_star_catalog on a CSV with the given lines, checked against iter_star_catalog."""
+        filename = os.path.join(self.directory.name, "catalog.csv")
+        with open(filename, "w", encoding="utf-8", newline="") as file:
+            file.write(newline.join(text.strip("\n").split("\n")) + newline)
+        
+        result = process_star_catalog(filename)
+        
+        # The streaming loader must agree row for row
+        stats = CatalogStats()
+        self.assertEqual(list(iter_star_catalog(filename, stats)), result.data or [])
+        self.assertEqual(stats.errors, result.errors)
+        self.assertEqual((stats.total_records, stats.valid_records), (result.total_records, result.valid_records))
+        return result
+    
+    def test_valid_catalog(self):
+        result = self.load(f"""
+{HEADER}
+Sirius,6.752,-16.716,-1.46,A1V,Canis Major
+Vega, 18.615 ,38.784,0.03, A0V , Lyra
+""")
+        self.assertTrue(result.success)
+        self.assertEqual(result.errors, [])
+        self.assertEqual([star.name for star in result.data], ["Sirius", "Vega"])
+        vega = result.data[1]
+        self.assertEqual((vega.ra_hours, vega.spectral_type, vega.constellation), (18.615, "A0V", "Lyra"))
+    
+    def test_rejected_row_messages_and_numbering(self):
+        # Blank lines are not records and do not advance the row number
+        result = self.load(f"""
+{HEADER}
+Sirius,6.752,-16.716,-1.46,A1V,Canis Major
+
+Bad,abc,0,1,A,Orion
+Far,25,-95,9,A,Orion
+,1,1,1,A,
+Vega,18.615,38.784,0.03,A0V,Lyra
+""")
+        self.assertEqual([star.name for star in result.data], ["Sirius", "Vega"])
+        self.assertEqual((result.total_records, result.valid_records), (5, 2))
+        self.assertEqual(result.errors, [
+            "Row 2: Parse error in row {'name': 'Bad', 'ra_hours': 'abc', 'dec_degrees': '0', "
+            "'magnitude': '1', 'spectral_type': 'A', 'constellation': 'Orion'}: "
+            "could not convert string to float: 'abc'",
+            "Row 3 (Far): RA out of range: 25.0; Dec out of range: -95.0; Magnitude out of range: 9.0",
+            "Row 4 (): Missing name; Missing constellation",
+        ])
+    
+    def test_nan_and_empty_fields(self):
+        result = self.load(f"""
+{HEADER}
+NaNstar,nan,0,1,A,Orion
+Empty,1,,1,A,Orion
+""")
+        self.assertFalse(result.success)
+        self.assertIsNone(result.data)
+        self.assertEqual(result.errors[0], "Row 1 (NaNstar): RA out of range: nan")
+        self.assertTrue(result.errors[1].startswith("Row 2: Parse error in row "))
+        self.assertTrue(result.errors[1].endswith("could not convert string to float: ''"))
+    
+    def test_short_and_long_rows(self):
+        result = self.load(f"""
+{HEADER}
+Short,6.752,-16.716,-1.46
+Extra,18.615,38.784,0.03,A0V,Lyra,surplus
+""")
+        # Extra fields are ignored; a short row is a parse error, not a crash
+        self.assertEqual([star.name for star in result.data], ["Extra"])
+        self.assertEqual(len(result.errors), 1)
+        self.assertTrue(result.errors[0].startswith("Row 1: Parse error in row {'name': 'Short'"))
+    
+    def test_missing_and_reordered_columns(self):
+        result = self.load("""
+constellation,magnitude,name,dec_degrees,ra_hours
+Lyra,0.03,Vega,38.784,18.615
+""")
+        # A missing column reads as its default: spectral_type is optional
+        self.assertEqual(result.errors, [])
+        vega = result.data[0]
+        self.assertEqual((vega.name, vega.ra_hours, vega.dec_degrees, vega.spectral_type), ("Vega", 18.615, 38.784, ""))
+        
+        result = self.load("""
+ra_hours,dec_degrees,magnitude,constellation
+18.615,38.784,0.03,Lyra
+""")
+        self.assertFalse(result.success)
+        self.assertEqual(result.errors, ["Row 1 (): Missing name"])
+    
+    def test_crlf_line_endings(self):
+        text = f"""
+{HEADER}
+Sirius,6.752,-16.716,-1.46,A1V,Canis Major
+
+Vega,18.615,38.784,0.03,A0V,Lyra
+"""
+        self.assertEqual(self.load(text, newline="\r\n"), self.load(text))
+        self.assertEqual(self.load(text, newline="\r\n").data[1].constellation, "Lyra")
+    
+    def test_missing_file(self):
+        filename = os.path.join(self.directory.name, "missing.csv")
+        result = process_star_catalog(filename)
+        self.assertFalse(result.success)
+        self.assertEqual(result.errors, [f"Catalog file not found: {filename}"])
+        
+        stats = CatalogStats()
+        self.assertEqual(list(iter_star_catalog(filename, stats)), [])
+        self.assertEqual(stats.errors, result.errors)
+
+
+if __name__ == "__main__":
+    unittest.main()
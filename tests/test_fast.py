@@ -0,0 +1,72 @@
+"""
+Parity tests for the Numba kernels against the pure Python/NumPy paths.
+Skipped when Numba is not installed.
+Run with: python -m unittest discover tests
+"""
+
+import unittest
+
+import numpy as np
+
+from src.calculations.coordinates import alt_az_from_star_trig, star_trig_terms
+from src.calculations.visibility import _rise_set_core
+from src.data.models import ObserverLocation
+
+try:
+    from src.calculations._fast import alt_az_batch, rise_set_core
+except ImportError:
+    alt_az_batch = rise_set_core = None
+
+
+# Every 7.5°, so the grid holds the poles, the equator and dec + lat = ±90
+DECLINATIONS = np.arange(-90.0, 90.1, 7.5)
+LATITUDES = np.arange(-90.0, 90.1, 7.5)
+
+
+@unittest.skipIf(rise_set_core is None, "Numba is not installed")
+class FastKernelParityTest(unittest.TestCase):
+    
+    def test_rise_set_core_matches_python(self):
+        for latitude in LATITUDES:
+            observer = ObserverLocation(float(latitude), 0.0, "Grid")
+            for dec in DECLINATIONS:
+                for ra in (0.0, 6.5, 23.9):
+                    args = (ra, float(dec), observer.latitude, observer.sin_lat_rad, observer.cos_lat_rad, 7.25)
+                    fast = rise_set_core(*args)
+                    python = _rise_set_core(*args)
+                    
+                    # Same classification, including pole stars seen from the equator
+                    self.assertEqual(fast[4], python[4], (latitude, dec))
+                    for fast_offset, python_offset in zip(fast[:3], python[:3]):
+                        self.assertAlmostEqual(fast_offset, python_offset, delta=1e-5, msg=(latitude, dec))
+                    self.assertAlmostEqual(fast[3], python[3], delta=1e-4, msg=(latitude, dec))
+    
+    def test_alt_az_batch_matches_numpy(self):
+        ra_grid, dec_grid = np.meshgrid(np.arange(0.0, 24.0, 0.75), DECLINATIONS)
+        ra_hours, dec_degrees = ra_grid.ravel(), dec_grid.ravel()
+        lst_hours = np.full(ra_hours.shape, 5.3)
+        
+        for latitude in LATITUDES:
+            observer = ObserverLocation(float(latitude), 0.0, "Grid")
+            altitudes = np.empty_like(ra_hours)
+            azimuths = np.empty_like(ra_hours)
+            alt_az_batch(ra_hours, dec_degrees, observer.sin_lat_rad, observer.cos_lat_rad,
+                         lst_hours, altitudes, azimuths)
+            expected_altitudes, expected_azimuths = alt_az_from_star_trig(
+                *star_trig_terms(ra_hours, dec_degrees), observer, 5.3
+            )
+            
+            np.testing.assert_allclose(altitudes, expected_altitudes, rtol=0, atol=1e-4)
+            
+            # Azimuth is undefined at the zenith and nadir, and for a celestial
+            # pole seen from a geographic pole; elsewhere compare the angle
+            # between the two, so 0° and 360° agree
+            defined = np.abs(expected_altitudes) < 89.99
+            if abs(latitude) == 90.0:
+                defined &= np.abs(dec_degrees) != 90.0
+            difference = (azimuths - expected_azimuths + 180.0) % 360.0 - 180.0
+            np.testing.assert_allclose(difference[defined], 0.0, rtol=0, atol=1e-6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+"""
+Tests for location parsing and city suggestions.
+Run with: python -m unittest discover tests
+"""
+
+import math
+import unittest
+
+from src.data.location_parser import (
+    _DMS_RE, format_coordinate_dms, parse_coordinate_string, suggest_similar_cities
+)
+
+
+def parse_float_first(coord_str):
+    """The former parse_coordinate_string: float() first, then the DMS pattern."""
+    coord_str = coord_str.strip().upper()
+    try:
+        return True, float(coord_str), ""
+    except ValueError:
+        pass
+    match = _DMS_RE.match(coord_str)
+    if match:
+        degrees, minutes, seconds, dm_minutes, direction = match.groups()
+        if seconds is not None:
+            decimal = int(degrees) + int(minutes)/60.0 + float(seconds)/3600.0
+        else:
+            decimal = int(degrees) + float(dm_minutes)/60.0
+        return True, -decimal if direction in ['S', 'W'] else decimal, ""
+    return False, 0.0, f"Could not parse coordinate: {coord_str}"
+
+
+class SuggestSimilarCitiesTest(unittest.TestCase):
+    
+    def test_substring_inside_a_word(self):
+        self.assertEqual(suggest_similar_cities("ork"), ["New York, NY"])
+        self.assertEqual(suggest_similar_cities("angel"), ["Los Angeles, CA"])
+    
+    def test_prefix_matches_come_first(self):
+        self.assertEqual(suggest_similar_cities("lon")[0], "London, UK")
+        self.assertEqual(suggest_similar_cities("San")[:2], ["San Francisco, CA", "Santiago, Chile"])
+    
+    def test_any_word_of_the_input(self):
+        self.assertIn("New York, NY", suggest_similar_cities("york new"))
+    
+    def test_typo_falls_back_to_closest_spelling(self):
+        self.assertIn("London, UK", suggest_similar_cities("Londn"))
+    
+    def test_limit_and_empty_input(self):
+        self.assertLessEqual(len(suggest_similar_cities("a", max_suggestions=3)), 3)
+        self.assertEqual(suggest_similar_cities(""), [])
+
+
+
+class FormatCoordinateDmsTest(unittest.TestCase):
+    
+    def test_directions(self):
+        self.assertEqual(format_coordinate_dms(51.5074, True), "51°30'26.64\"N")
+        self.assertEqual(format_coordinate_dms(-33.8688, True), "33°52'07.68\"S")
+        self.assertEqual(format_coordinate_dms(-0.1278, False), "0°07'40.08\"W")
+        self.assertEqual(format_coordinate_dms(0.0, False), "0°00'00.00\"E")
+    
+    def test_seconds_that_round_up_carry_into_minutes(self):
+        # 4.3° is 4°17'59.99999...", which used to print as 4°17'60.00"
+        self.assertEqual(format_coordinate_dms(4.3, True), "4°18'00.00\"N")
+        self.assertEqual(format_coordinate_dms(-4.3, False), "4°18'00.00\"W")
+        # and on through the degrees
+        self.assertEqual(format_coordinate_dms(59.99999999, True), "60°00'00.00\"N")
+    
+    def test_never_prints_sixty(self):
+        for i in range(20000):
+            text = format_coordinate_dms(i * 0.0090001, True)
+            minutes, seconds = text[text.index("°") + 1:].split("'")
+            self.assertLess(int(minutes), 60, text)
+            self.assertLess(float(seconds[:-2]), 60.0, text)
+
+
+
+class ParseCoordinateStringTest(unittest.TestCase):
+    
+    def test_decimal_degrees(self):
+        self.assertEqual(parse_coordinate_string("40.7128"), (True, 40.7128, ""))
+        self.assertEqual(parse_coordinate_string(" -74.006 "), (True, -74.006, ""))
+    
+    def test_dms_and_degrees_minutes(self):
+        self.assertAlmostEqual(parse_coordinate_string("40°42'46\"N")[1], 40.7127778, places=6)
+        self.assertAlmostEqual(parse_coordinate_string("40d42m46sN")[1], 40.7127778, places=6)
+        self.assertAlmostEqual(parse_coordinate_string("74°0'21.6\"W")[1], -74.006, places=9)
+        self.assertAlmostEqual(parse_coordinate_string("40°42.5'S")[1], -40.7083333, places=6)
+    
+    def test_unparseable(self):
+        for text in ("", "abc", "12.5N", "40°", "D"):
+            self.assertEqual(
+                parse_coordinate_string(text),
+                (False, 0.0, f"Could not parse coordinate: {text.strip().upper()}")
+            )
+    
+    def test_marker_dispatch_matches_float_first(self):
+        # Choosing the parser by the degree marker must not change any result
+        numbers = ["", "4", "40", "-1", "42.5", "1e1", "nan", "x"]
+        markers = ["", "°", "D", "d", "'", "M", "\"", "S", "N", "W", " "]
+        pairs = [number + marker for number in numbers for marker in markers]
+        texts = [a + b + marker for a in pairs for b in pairs for marker in markers]
+        for text in texts:
+            expected = parse_float_first(text)
+            actual = parse_coordinate_string(text)
+            if expected[0] and math.isnan(expected[1]):
+                self.assertTrue(actual[0] and math.isnan(actual[1]), text)
+            else:
+                self.assertEqual(actual, expected, text)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+"""
+Regression tests for time-range visibility.
+Run with: python -m unittest discover tests
+"""
+
+import unittest
+import warnings
+from datetime import datetime, timedelta, timezone
+
+from src.calculations.coordinates import ra_dec_to_alt_az
+from src.calculations.visibility import calculate_visibility_for_time_range
+from src.data.models import ObserverLocation, StellarObject
+
+
+STARS = [
+    StellarObject(f"Star {ra}/{dec}", ra / 2.0, float(dec), 1.0, "A0V", "Test")
+    for ra in range(48)
+    for dec in range(-80, 90, 20)
+]
+
+# No grid star passes near the zenith, where minute sampling misses the peak
+OBSERVER = ObserverLocation(51.5074, -0.1278, "London", 0.0)
+
+
+def brute_force_max_altitudes(stars, observer, start_time, end_time):
+    """Highest altitude of each star, sampled every minute across the range."""
+    steps = int((end_time - start_time) / timedelta(minutes=1))
+    times = [start_time + timedelta(minutes=i) for i in range(steps + 1)]
+    return {
+        star.name: max(
+            ra_dec_to_alt_az(star.ra_hours, star.dec_degrees, observer, t).altitude
+            for t in times
+        )
+        for star in stars
+    }
+
+
+class TimeRangeVisibilityTest(unittest.TestCase):
+    
+    def assert_matches_brute_force(self, start_time, end_time, min_altitude=10.0):
+        results = calculate_visibility_for_time_range(
+            STARS, OBSERVER, start_time, end_time, min_altitude
+        )
+        expected = brute_force_max_altitudes(STARS, OBSERVER, start_time, end_time)
+        
+        by_name = {info.object_name: info for info in results}
+        for name, altitude in expected.items():
+            if altitude > min_altitude + 0.01:
+                self.assertIn(name, by_name)
+            elif altitude < min_altitude - 0.01:
+                self.assertNotIn(name, by_name)
+        
+        for name, info in by_name.items():
+            # The closed form finds the true maximum; sampling can only undershoot
+            self.assertGreaterEqual(info.altitude, expected[name] - 1e-9)
+            self.assertAlmostEqual(info.altitude, expected[name], delta=0.002)
+            self.assertGreaterEqual(info.max_altitude_time, start_time)
+            self.assertLessEqual(info.max_altitude_time, end_time)
+    
+    def test_naive_range_matches_brute_force(self):
+        start_time = datetime(2025, 1, 15, 20, 0)
+        self.assert_matches_brute_force(start_time, start_time + timedelta(hours=6))
+    
+    def test_aware_range_matches_brute_force(self):
+        start_time = datetime(2025, 7, 1, 21, 30, tzinfo=timezone(timedelta(hours=2)))
+        self.assert_matches_brute_force(start_time, start_time + timedelta(hours=5))
+    
+    def test_time_step_minutes_is_deprecated(self):
+        start_time = datetime(2025, 1, 15, 20, 0)
+        end_time = start_time + timedelta(hours=2)
+        
+        with self.assertWarns(DeprecationWarning):
+            calculate_visibility_for_time_range(
+                STARS, OBSERVER, start_time, end_time, time_step_minutes=30
+            )
+        
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            calculate_visibility_for_time_range(STARS, OBSERVER, start_time, end_time)
+
+
+if __name__ == "__main__":
+    unittest.main()